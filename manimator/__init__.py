@@ -2,3 +2,24 @@
 
 __version__ = "0.1.0"
 __app_name__ = "manimator"
+
+# Public classes re-exported lazily (PEP 562) so `import manimator` stays cheap
+_LAZY = {
+    "ConfigManager": "manimator.config_manager",
+    "AutoCorrector": "manimator.corrector",
+    "ManimRenderer": "manimator.renderer",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = value  # cache so later lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY])
@@ -0,0 +1,24 @@
+"""Console-script entry point for manimator (also runs `python -m manimator`)."""
+
+import sys
+
+
+def main() -> None:
+    """Run the manimator CLI for the current process's arguments."""
+    argv = sys.argv[1:]
+    # Fast path: answer `manimator --version` before Typer and Rich are imported.
+    # Only root-level flags are inspected so a subcommand argument is never mistaken for it.
+    for arg in argv:
+        if arg in ("-V", "--version"):
+            from manimator import __app_name__, __version__
+            print(f"{__app_name__} version {__version__}")
+            return
+        if not arg.startswith("-"):
+            break
+
+    from manimator.cli import app_for_argv
+    app_for_argv(argv)(prog_name="manimator")
+
+
+if __name__ == "__main__":
+    main()
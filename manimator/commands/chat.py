@@ -0,0 +1,202 @@
+"""'chat' command — interactive describe, render, and iterate session."""
+
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.table import Table
+
+from manimator.commands.shared import get_config_manager, get_provider, load_config
+from manimator.constants import (
+    PROVIDERS_ORDERED,
+    QUALITY_CHOICES,
+    QUALITY_CHOICES_ORDERED,
+    VALID_PROVIDERS,
+    validate_choice,
+)
+from manimator.conversation import ConversationManager, generate_video_name, generate_unique_filename
+from manimator.corrector import AutoCorrector
+from manimator.prompt_builder import build_user_prompt, build_followup_prompt
+from manimator.renderer import ManimRenderer
+from manimator.utils.banner import print_banner
+from manimator.utils.logger import console, log_error, log_success
+from manimator.utils.preview import open_video
+
+# Inputs that end the follow-up loop (compared case-insensitively)
+_EXIT_WORDS = frozenset({"done", "quit", "exit", "q"})
+
+# History sent with each follow-up. Every follow-up prompt already embeds the
+# latest code, so older follow-ups only add tokens; the opening description and
+# its reply are always kept (see ConversationManager).
+_MAX_HISTORY_MESSAGES = 20
+
+
+def run(
+    quality: Optional[str] = None,
+    preview: bool = False,
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    output: Optional[Path] = None,
+    retries: Optional[int] = None,
+    verbose: bool = False,
+) -> None:
+    """Interactive chat session — describe, render, then iterate with follow-up changes."""
+    if provider is not None:
+        provider = validate_choice(provider, "provider", VALID_PROVIDERS, PROVIDERS_ORDERED)
+    config_manager = get_config_manager()
+    cfg = load_config()
+
+    resolved_quality = quality or cfg.default_quality
+    resolved_provider = provider or cfg.provider
+    resolved_model = model or cfg.model
+    resolved_output = output or Path(cfg.output_dir)
+    resolved_retries = retries if retries is not None else cfg.max_retries
+    resolved_preview = preview or cfg.auto_preview
+    resolved_verbose = verbose or cfg.verbose
+
+    resolved_quality = validate_choice(resolved_quality, "quality", QUALITY_CHOICES, QUALITY_CHOICES_ORDERED)
+
+    try:
+        llm_provider = get_provider(
+            resolved_provider, resolved_model, config_manager, cache=cfg.cache_responses
+        )
+    except RuntimeError as e:
+        log_error(str(e))
+        raise typer.Exit(1)
+
+    cache_dir = config_manager.ensure_cache_dir()
+    renderer = ManimRenderer(cache_dir=cache_dir)
+
+    corrector = AutoCorrector(
+        provider=llm_provider,
+        renderer=renderer,
+        max_retries=resolved_retries,
+        verbose=resolved_verbose,
+    )
+
+    conversation = ConversationManager(max_messages=_MAX_HISTORY_MESSAGES)
+    generated_videos: list[Path] = []
+
+    # ── Banner ────────────────────────────────────────────────────────────
+    print_banner()
+    console.print("[bold cyan]Interactive Chat Mode[/bold cyan]")
+    console.print("[dim]Describe your animation, render it, then iterate with follow-up changes.[/dim]")
+    console.print("[dim]Type [bold]done[/bold], [bold]quit[/bold], or [bold]exit[/bold] to end the session.[/dim]\n")
+
+    # ── Step 1: Initial description ────────────────────────────────────────
+    description = _ask("[bold magenta]🎬 Describe your animation[/bold magenta]")
+    if not description.strip():
+        log_error("Empty description. Exiting.")
+        raise typer.Exit(1)
+
+    # Auto-generate a video name from the description
+    base_name = generate_video_name(description)
+    version = 1
+    output_file = generate_unique_filename(resolved_output, base_name, version)
+
+    # Build initial prompt and generate
+    user_prompt = build_user_prompt(description)
+    conversation.add_user_message(user_prompt)
+
+    output_path, last_code = corrector.run(
+        description=description,
+        quality=resolved_quality,
+        output_dir=resolved_output,
+        output_filename=output_file.name,
+    )
+
+    if output_path:
+        generated_videos.append(output_path)
+        if not last_code:
+            # Fall back to the renderer's cache if the code was not returned
+            last_code = _read_last_generated_code(cache_dir)
+        conversation.add_assistant_message(last_code)
+
+        if resolved_preview:
+            log_success("Opening video preview…")
+            open_video(output_path)
+    else:
+        log_error("Initial generation failed. Exiting chat session.")
+        raise typer.Exit(1)
+
+    # ── Follow-up loop ─────────────────────────────────────────────────────
+    while True:
+        console.print()
+        change_request = _ask(
+            "[bold yellow]✏  Enter follow-up changes[/bold yellow] [dim](or 'done' to finish)[/dim]"
+        ).strip()
+        if not change_request:
+            console.print("[dim]Empty input — skipping.[/dim]")
+            continue
+
+        if change_request.lower() in _EXIT_WORDS:
+            break
+
+        version += 1
+        output_file = generate_unique_filename(resolved_output, base_name, version)
+
+        # Build follow-up prompt with previous code
+        followup_prompt = build_followup_prompt(change_request, last_code)
+        conversation.add_user_message(followup_prompt)
+
+        followup_path, new_code = corrector.run_followup(
+            messages=conversation.messages,
+            quality=resolved_quality,
+            output_dir=resolved_output,
+            output_filename=output_file.name,
+        )
+
+        if followup_path:
+            generated_videos.append(followup_path)
+            last_code = new_code
+            conversation.add_assistant_message(new_code)
+
+            if resolved_preview:
+                log_success("Opening video preview…")
+                open_video(followup_path)
+        else:
+            log_error("Follow-up generation failed. You can try again or type 'done' to exit.")
+            if new_code:
+                conversation.add_assistant_message(new_code)
+                last_code = new_code
+
+    # ── Session summary ────────────────────────────────────────────────────
+    console.print()
+    if generated_videos:
+        table = Table(title="[bold cyan]🎞  Generated Videos[/bold cyan]", show_header=True)
+        table.add_column("#", style="bold", width=4)
+        table.add_column("File", style="green")
+        for i, vpath in enumerate(generated_videos, 1):
+            table.add_row(str(i), str(vpath))
+        console.print(table)
+    console.print("\n[bold cyan]👋 Chat session ended. Happy animating![/bold cyan]\n")
+
+
+def _ask(prompt: str) -> str:
+    """
+    Read one line of user input.
+
+    Piped (non-TTY) sessions read stdin directly, skipping Rich's prompt rendering.
+    """
+    if not sys.stdin.isatty():
+        return input()
+    from rich.prompt import Prompt
+    return Prompt.ask(prompt)
+
+
+def _read_last_generated_code(cache_dir: Path) -> str:
+    """Read the most recently created Python script from the cache directory."""
+    # Single pass with one stat per entry (DirEntry caches it) instead of a sort.
+    latest_path = None
+    latest_mtime = -1.0
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("scene_") and entry.name.endswith(".py"):
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest_mtime, latest_path = mtime, entry.path
+    if latest_path:
+        return Path(latest_path).read_text(encoding="utf-8")
+    return ""
@@ -1,41 +1,46 @@
 """'config' command — manage persistent manimator settings."""
 
-from typing import Optional
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.table import Table
-from typing_extensions import Annotated
 
-from manimator.config_manager import ConfigManager
-from manimator.utils.logger import console, log_success, log_info, log_error
-
-app = typer.Typer()
-
-VALID_PROVIDERS = ["openai", "anthropic", "ollama", "gemini"]
-VALID_QUALITIES = ["low", "medium", "high", "ultra"]
-
-
-@app.command()
-def config(
-    key: Annotated[Optional[str], typer.Option("--key", help="API key for the active provider")] = None,
-    provider: Annotated[Optional[str], typer.Option("--provider", help="LLM provider: openai | anthropic | ollama | gemini")] = None,
-    output: Annotated[Optional[str], typer.Option("--output", help="Default output directory")] = None,
-    model: Annotated[Optional[str], typer.Option("--model", help="Default model name")] = None,
-    retries: Annotated[Optional[int], typer.Option("--retries", help="Max auto-correction attempts")] = None,
-    quality: Annotated[Optional[str], typer.Option("--quality", help="Default quality: low | medium | high | ultra")] = None,
-    auto_preview: Annotated[Optional[bool], typer.Option("--auto-preview/--no-auto-preview", help="Auto-open video after render")] = None,
-    show: Annotated[bool, typer.Option("--show", help="Print current configuration")] = False,
+from manimator.constants import (
+    PROVIDERS_ORDERED,
+    QUALITY_CHOICES,
+    QUALITY_CHOICES_ORDERED,
+    VALID_PROVIDERS,
+    validate_choice,
+)
+
+if TYPE_CHECKING:
+    from manimator.config_manager import ConfigManager
+
+
+def run(
+    key: Optional[str] = None,
+    provider: Optional[str] = None,
+    output: Optional[str] = None,
+    model: Optional[str] = None,
+    retries: Optional[int] = None,
+    quality: Optional[str] = None,
+    auto_preview: Optional[bool] = None,
+    cache_responses: Optional[bool] = None,
+    show: bool = False,
 ) -> None:
     """View or update manimator configuration."""
-    config_manager = ConfigManager()
-    cfg = config_manager.load()
+    # Imported here so loading this module does not pull in keyring, pydantic or Rich
+    from manimator.commands.shared import get_config_manager, load_config
+    from manimator.utils.logger import log_success, log_error
+
+    config_manager = get_config_manager()
+    cfg = load_config()
     changed = False
 
     # Validate provider
     if provider is not None:
-        if provider not in VALID_PROVIDERS:
-            log_error(f"Invalid provider '{provider}'. Choose from: {', '.join(VALID_PROVIDERS)}")
-            raise typer.Exit(1)
+        provider = validate_choice(provider, "provider", VALID_PROVIDERS, PROVIDERS_ORDERED)
         cfg.provider = provider
         changed = True
         log_success(f"Provider set to [bold]{provider}[/bold]")
@@ -52,9 +57,10 @@ def config(
         log_success(f"Default model set to [bold]{model}[/bold]")
 
     if output is not None:
-        from pathlib import Path
-        out_path = Path(output).expanduser().resolve()
-        out_path.mkdir(parents=True, exist_ok=True)
+        # abspath normalises the path without resolve()'s per-component syscalls
+        out_path = Path(os.path.abspath(os.path.expanduser(output)))
+        if not out_path.is_dir():
+            out_path.mkdir(parents=True, exist_ok=True)
         cfg.output_dir = str(out_path)
         changed = True
         log_success(f"Output directory set to [bold]{out_path}[/bold]")
@@ -68,9 +74,7 @@ def config(
         log_success(f"Max retries set to [bold]{retries}[/bold]")
 
     if quality is not None:
-        if quality not in VALID_QUALITIES:
-            log_error(f"Invalid quality '{quality}'. Choose from: {', '.join(VALID_QUALITIES)}")
-            raise typer.Exit(1)
+        quality = validate_choice(quality, "quality", QUALITY_CHOICES, QUALITY_CHOICES_ORDERED)
         cfg.default_quality = quality  # type: ignore[assignment]
         changed = True
         log_success(f"Default quality set to [bold]{quality}[/bold]")
@@ -80,30 +84,46 @@ def config(
         changed = True
         log_success(f"Auto-preview set to [bold]{auto_preview}[/bold]")
 
+    if cache_responses is not None:
+        cfg.cache_responses = cache_responses
+        changed = True
+        log_success(f"Response cache set to [bold]{cache_responses}[/bold]")
+
     if changed:
         config_manager.save(cfg)
+        load_config.cache_clear()
 
-    if show or not any([key, provider, output, model, retries, quality, auto_preview is not None]):
+    # Every option except --key marks the config as changed
+    any_flag_set = changed or key is not None
+    if show or not any_flag_set:
         _print_config(config_manager, cfg)
 
 
-def _print_config(config_manager: ConfigManager, cfg) -> None:
+def _print_config(config_manager: "ConfigManager", cfg) -> None:
     """Render the current configuration as a Rich table."""
+    from rich.table import Table
+    from manimator.utils.logger import console
+
     masked = config_manager.masked_config(cfg)
 
+    rows = (
+        ("Config file", str(config_manager.config_path)),
+        ("Provider", masked.get("provider", "")),
+        ("Model", masked.get("model", "")),
+        ("API Key", masked.get("api_key", "(not set)")),
+        ("Output directory", masked.get("output_dir", "")),
+        ("Default quality", masked.get("default_quality", "")),
+        ("Max retries", str(masked.get("max_retries", ""))),
+        ("Auto-preview", str(masked.get("auto_preview", ""))),
+        ("Verbose", str(masked.get("verbose", ""))),
+        ("Response cache", str(masked.get("cache_responses", ""))),
+    )
+
     table = Table(title="[bold cyan]manimator Configuration[/bold cyan]", show_header=True)
     table.add_column("Setting", style="bold")
     table.add_column("Value", style="green")
-
-    table.add_row("Config file", str(config_manager.config_path))
-    table.add_row("Provider", masked.get("provider", ""))
-    table.add_row("Model", masked.get("model", ""))
-    table.add_row("API Key", masked.get("api_key", "(not set)"))
-    table.add_row("Output directory", masked.get("output_dir", ""))
-    table.add_row("Default quality", masked.get("default_quality", ""))
-    table.add_row("Max retries", str(masked.get("max_retries", "")))
-    table.add_row("Auto-preview", str(masked.get("auto_preview", "")))
-    table.add_row("Verbose", str(masked.get("verbose", "")))
+    for row in rows:
+        table.add_row(*row)
 
     console.print()
     console.print(table)
@@ -4,96 +4,60 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from typing_extensions import Annotated
 
-from manimator.config_manager import ConfigManager
+from manimator.commands.shared import get_config_manager, get_provider, load_config
+from manimator.constants import (
+    PROVIDERS_ORDERED,
+    QUALITY_CHOICES,
+    QUALITY_CHOICES_ORDERED,
+    VALID_PROVIDERS,
+    validate_choice,
+)
+from manimator.conversation import generate_video_name, generate_unique_filename
 from manimator.corrector import AutoCorrector
 from manimator.renderer import ManimRenderer
 from manimator.utils.logger import log_error, log_success
 from manimator.utils.preview import open_video
 
-app = typer.Typer()
 
-QUALITY_CHOICES = ["low", "medium", "high", "ultra"]
-
-
-def _get_provider(provider_name: str, model: str, config_manager: ConfigManager):
-    """Instantiate the correct LLM provider."""
-    api_key = config_manager.get_api_key(provider_name)
-
-    if provider_name == "openai":
-        from manimator.providers.openai_provider import OpenAIProvider
-        if not api_key:
-            log_error("OpenAI API key not set. Run: manimator config --key <key> --provider openai")
-            raise typer.Exit(1)
-        return OpenAIProvider(api_key=api_key, model=model)
-
-    elif provider_name == "anthropic":
-        from manimator.providers.anthropic_provider import AnthropicProvider
-        if not api_key:
-            log_error("Anthropic API key not set. Run: manimator config --key <key> --provider anthropic")
-            raise typer.Exit(1)
-        return AnthropicProvider(api_key=api_key, model=model)
-
-    elif provider_name == "gemini":
-        from manimator.providers.gemini_provider import GeminiProvider
-        if not api_key:
-            log_error("Gemini API key not set. Run: manimator config --key <key> --provider gemini")
-            raise typer.Exit(1)
-        return GeminiProvider(api_key=api_key, model=model)
-
-    elif provider_name == "ollama":
-        from manimator.providers.ollama_provider import OllamaProvider
-        return OllamaProvider(model=model)
-
-    else:
-        log_error(f"Unknown provider: {provider_name}")
-        raise typer.Exit(1)
-
-
-@app.command()
-def create(
-    description: Annotated[str, typer.Argument(help="Natural-language description of the animation")],
-    quality: Annotated[
-        Optional[str],
-        typer.Option("--quality", "-q", help="Render quality: low | medium | high | ultra"),
-    ] = None,
-    preview: Annotated[bool, typer.Option("--preview", "-p", help="Open video after render")] = False,
-    provider: Annotated[Optional[str], typer.Option(help="LLM provider: openai | anthropic | ollama | gemini")] = None,
-    model: Annotated[Optional[str], typer.Option(help="Model name (overrides config default)")] = None,
-    output: Annotated[Optional[Path], typer.Option("--output", "-o", help="Output directory")] = None,
-    retries: Annotated[Optional[int], typer.Option("--retries", "-r", help="Max auto-correction attempts")] = None,
-    verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Show generated code and LLM prompts")] = False,
+def run(
+    description: str,
+    quality: Optional[str] = None,
+    preview: bool = False,
+    provider: Optional[str] = None,
+    model: Optional[str] = None,
+    output: Optional[Path] = None,
+    retries: Optional[int] = None,
+    verbose: bool = False,
 ) -> None:
     """Generate a Manim animation from a natural-language description."""
-    config_manager = ConfigManager()
-    config = config_manager.load()
+    if provider is not None:
+        provider = validate_choice(provider, "provider", VALID_PROVIDERS, PROVIDERS_ORDERED)
+    config_manager = get_config_manager()
+    cfg = load_config()
 
     # Resolve options (CLI flags override config defaults)
-    resolved_quality = quality or config.default_quality
-    resolved_provider = provider or config.provider
-    resolved_model = model or config.model
-    resolved_output = output or Path(config.output_dir)
-    resolved_retries = retries if retries is not None else config.max_retries
-    resolved_preview = preview or config.auto_preview
-    resolved_verbose = verbose or config.verbose
+    resolved_quality = quality or cfg.default_quality
+    resolved_provider = provider or cfg.provider
+    resolved_model = model or cfg.model
+    resolved_output = output or Path(cfg.output_dir)
+    resolved_retries = retries if retries is not None else cfg.max_retries
+    resolved_preview = preview or cfg.auto_preview
+    resolved_verbose = verbose or cfg.verbose
 
-    if resolved_quality not in QUALITY_CHOICES:
-        log_error(f"Invalid quality '{resolved_quality}'. Choose from: {', '.join(QUALITY_CHOICES)}")
-        raise typer.Exit(1)
+    resolved_quality = validate_choice(resolved_quality, "quality", QUALITY_CHOICES, QUALITY_CHOICES_ORDERED)
 
-    # Instantiate provider
     try:
-        llm_provider = _get_provider(resolved_provider, resolved_model, config_manager)
+        llm_provider = get_provider(
+            resolved_provider, resolved_model, config_manager, cache=cfg.cache_responses
+        )
     except RuntimeError as e:
         log_error(str(e))
         raise typer.Exit(1)
 
-    # Set up renderer
     cache_dir = config_manager.ensure_cache_dir()
     renderer = ManimRenderer(cache_dir=cache_dir)
 
-    # Run the auto-correction pipeline
     corrector = AutoCorrector(
         provider=llm_provider,
         renderer=renderer,
@@ -101,10 +65,15 @@ def create(
         verbose=resolved_verbose,
     )
 
-    output_path = corrector.run(
+    # Auto-generate a unique filename from the description
+    base_name = generate_video_name(description)
+    output_file = generate_unique_filename(resolved_output, base_name, version=1)
+
+    output_path, _ = corrector.run(
         description=description,
         quality=resolved_quality,
         output_dir=resolved_output,
+        output_filename=output_file.name,
     )
 
     if output_path and resolved_preview:
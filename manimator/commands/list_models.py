@@ -1,15 +1,16 @@
 """'list-models' command — display available models per provider."""
 
+import importlib
+from collections.abc import Sequence
 from typing import Optional
 
-import typer
 from rich.table import Table
-from typing_extensions import Annotated
 
+from manimator.commands.shared import PROVIDERS, get_config_manager, load_config, load_provider_class
 from manimator.config_manager import ConfigManager
-from manimator.utils.logger import console, log_error, log_warning
-
-app = typer.Typer()
+from manimator.constants import PROVIDERS_ORDERED, VALID_PROVIDERS, validate_choice
+from manimator.providers.base import ModelSpec
+from manimator.utils.logger import console, log_warning
 
 PROVIDER_COLORS = {
     "openai": "green",
@@ -18,22 +19,38 @@ PROVIDER_COLORS = {
     "gemini": "blue",
 }
 
+# Providers whose model list is a bundled constant, read straight from the
+# provider module without building a client (no SDK import, no keyring lookup).
+# The rest (Ollama) are queried live, since the list is whatever is installed now.
+_STATIC_MODEL_LISTS = {
+    "openai": "OPENAI_MODELS",
+    "anthropic": "ANTHROPIC_MODELS",
+    "gemini": "GEMINI_MODELS",
+}
+
 
-@app.command()
-def list_models(
-    provider: Annotated[
-        Optional[str],
-        typer.Option("--provider", help="Filter by provider: openai | anthropic | ollama | gemini"),
-    ] = None,
-) -> None:
+def run(provider: Optional[str] = None) -> None:
     """List available models for all (or a specific) provider."""
-    config_manager = ConfigManager()
-    cfg = config_manager.load()
+    if provider is not None:
+        provider = validate_choice(provider, "provider", VALID_PROVIDERS, PROVIDERS_ORDERED)
+    config_manager = get_config_manager()
+    cfg = load_config()
 
     providers_to_query = (
         [provider] if provider else ["openai", "anthropic", "gemini", "ollama"]
     )
 
+    # Only Ollama is a live query; the other lists are bundled, so no thread pool
+    rows: list[tuple[str, str, str, str, str]] = []
+    for pname in providers_to_query:
+        color = PROVIDER_COLORS.get(pname, "white")
+        colored_pname = f"[{color}]{pname}[/{color}]"
+        try:
+            models = _provider_models(pname, cfg, config_manager)
+            rows.extend((m.name, colored_pname, m.context, m.speed, m.description) for m in models)
+        except Exception as e:
+            log_warning(f"Could not query [bold]{pname}[/bold]: {e}")
+
     table = Table(
         title="[bold cyan]Available Models[/bold cyan]",
         show_header=True,
@@ -44,47 +61,35 @@ def list_models(
     table.add_column("Context", min_width=14)
     table.add_column("Speed", min_width=12)
     table.add_column("Description")
-
-    for pname in providers_to_query:
-        color = PROVIDER_COLORS.get(pname, "white")
-        try:
-            provider_instance = _build_provider(pname, cfg, config_manager)
-            models = provider_instance.list_models()
-            for m in models:
-                table.add_row(
-                    m.get("name", ""),
-                    f"[{color}]{pname}[/{color}]",
-                    m.get("context", ""),
-                    m.get("speed", ""),
-                    m.get("description", ""),
-                )
-        except Exception as e:
-            log_warning(f"Could not query [bold]{pname}[/bold]: {e}")
+    for row in rows:
+        table.add_row(*row)
 
     console.print()
     console.print(table)
     console.print()
 
 
-def _build_provider(provider_name: str, cfg, config_manager: ConfigManager):
-    """Build a provider instance for listing models (no API key required for static lists)."""
-    api_key = config_manager.get_api_key(provider_name) or "placeholder"
+def _provider_models(provider_name: str, cfg, config_manager: ConfigManager) -> Sequence[ModelSpec]:
+    """Return one provider's model list."""
+    if provider_name in _STATIC_MODEL_LISTS:
+        return _static_models(provider_name)
+    return _build_provider(provider_name, cfg, config_manager).list_models()
 
-    if provider_name == "openai":
-        from manimator.providers.openai_provider import OpenAIProvider
-        return OpenAIProvider(api_key=api_key, model=cfg.model)
 
-    elif provider_name == "anthropic":
-        from manimator.providers.anthropic_provider import AnthropicProvider
-        return AnthropicProvider(api_key=api_key, model=cfg.model)
+def _build_provider(provider_name: str, cfg, config_manager: ConfigManager):
+    """Build a provider instance for listing models (no API key required for static lists)."""
+    entry = PROVIDERS.get(provider_name)
+    if entry is None:
+        raise ValueError(f"Unknown provider: {provider_name}")
 
-    elif provider_name == "gemini":
-        from manimator.providers.gemini_provider import GeminiProvider
-        return GeminiProvider(api_key=api_key, model=cfg.model)
+    provider_cls = load_provider_class(provider_name)
+    if entry[2]:
+        api_key = config_manager.get_api_key(provider_name) or "placeholder"
+        return provider_cls(api_key=api_key, model=cfg.model)
+    return provider_cls(model=cfg.model)
 
-    elif provider_name == "ollama":
-        from manimator.providers.ollama_provider import OllamaProvider
-        return OllamaProvider(model=cfg.model)
 
-    else:
-        raise ValueError(f"Unknown provider: {provider_name}")
+def _static_models(provider_name: str) -> Sequence[ModelSpec]:
+    """Return a provider's bundled model list without instantiating the provider."""
+    module = importlib.import_module(PROVIDERS[provider_name][0])
+    return getattr(module, _STATIC_MODEL_LISTS[provider_name])
@@ -0,0 +1,72 @@
+"""Helpers shared by the manimator command implementations."""
+
+import functools
+import importlib
+
+import typer
+
+from manimator.config_manager import ConfigManager, ManimatorConfig
+from manimator.utils.logger import log_error
+
+# Provider name -> (module, class name, requires an API key).
+# Modules are imported on demand so only the selected provider's SDK is loaded.
+PROVIDERS = {
+    "openai": ("manimator.providers.openai_provider", "OpenAIProvider", True),
+    "anthropic": ("manimator.providers.anthropic_provider", "AnthropicProvider", True),
+    "gemini": ("manimator.providers.gemini_provider", "GeminiProvider", True),
+    "ollama": ("manimator.providers.ollama_provider", "OllamaProvider", False),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_manager() -> ConfigManager:
+    """Return the process-wide ConfigManager."""
+    return ConfigManager()
+
+
+@functools.lru_cache(maxsize=1)
+def load_config() -> ManimatorConfig:
+    """
+    Load the configuration once per process.
+
+    Call `load_config.cache_clear()` after saving so the next call re-reads it.
+    """
+    return get_config_manager().load()
+
+
+@functools.lru_cache(maxsize=None)
+def load_provider_class(provider_name: str):
+    """Import and return the provider class registered under `provider_name`."""
+    module_name, class_name, _ = PROVIDERS[provider_name]
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_provider(provider_name: str, model: str, config_manager, cache: bool = False):
+    """
+    Instantiate the correct LLM provider for generation.
+
+    With `cache`, identical requests are answered from the on-disk response cache.
+    """
+    if provider_name not in PROVIDERS:
+        log_error(f"Unknown provider: {provider_name}")
+        raise typer.Exit(1)
+
+    _, class_name, needs_key = PROVIDERS[provider_name]
+    kwargs = {"model": model} if model else {}
+    if needs_key:
+        api_key = config_manager.get_api_key(provider_name)
+        if not api_key:
+            label = class_name.removesuffix("Provider")
+            log_error(
+                f"{label} API key not set. "
+                f"Run: manimator config --key <key> --provider {provider_name}"
+            )
+            raise typer.Exit(1)
+        kwargs["api_key"] = api_key
+    llm_provider = load_provider_class(provider_name)(**kwargs)
+    if cache:
+        from manimator.providers.cache import CachingProvider, LLMCache
+
+        cache_path = config_manager.cache_dir.parent / "responses.sqlite3"
+        return CachingProvider(llm_provider, LLMCache(cache_path))
+    return llm_provider
@@ -1,20 +1,31 @@
 """Configuration management for manimator."""
 
-import json
 import os
 import sys
 from pathlib import Path
 from typing import Literal, Optional
 
 import keyring
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
+
+from manimator.utils import fastjson
 
 KEYRING_SERVICE = "manimator"
 
+# Environment variables checked when the keyring has no key for a provider
+_ENV_VAR_MAP = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+}
+
 
 class ManimatorConfig(BaseModel):
     """Pydantic v2 schema for manimator configuration."""
 
+    # Build the validator on first use rather than at import time
+    model_config = ConfigDict(defer_build=True)
+
     provider: Literal["openai", "anthropic", "ollama", "gemini"] = "openai"
     model: str = "gpt-4o"
     output_dir: str = str(Path.home() / "Videos" / "manimator")
@@ -22,6 +33,8 @@ class ManimatorConfig(BaseModel):
     default_quality: Literal["low", "medium", "high", "ultra"] = "medium"
     auto_preview: bool = False
     verbose: bool = False
+    # Opt-in: a cached reply repeats the same generation, so a failed run cannot be retried fresh
+    cache_responses: bool = False
 
     @field_validator("max_retries")
     @classmethod
@@ -55,6 +68,8 @@ class ConfigManager:
     def __init__(self) -> None:
         self._config_path = _get_config_path()
         self._cache_dir = _get_cache_dir()
+        # Keyring lookups can be a daemon round-trip; remember them per provider
+        self._key_cache: dict[str, Optional[str]] = {}
 
     @property
     def config_path(self) -> Path:
@@ -68,8 +83,9 @@ class ConfigManager:
         """Load config from disk, returning defaults if the file doesn't exist."""
         if self._config_path.exists():
             try:
-                data = json.loads(self._config_path.read_text(encoding="utf-8"))
-                return ManimatorConfig(**data)
+                # The file may have been edited by hand, so it is always validated.
+                # Parse and validate the raw bytes in a single pass.
+                return ManimatorConfig.model_validate_json(self._config_path.read_bytes())
             except Exception:
                 # Corrupt config — return defaults
                 return ManimatorConfig()
@@ -78,9 +94,7 @@ class ConfigManager:
     def save(self, config: ManimatorConfig) -> None:
         """Persist config to disk."""
         self._config_path.parent.mkdir(parents=True, exist_ok=True)
-        self._config_path.write_text(
-            config.model_dump_json(indent=2), encoding="utf-8"
-        )
+        self._config_path.write_bytes(fastjson.dumps(config.model_dump(), indent=True))
 
     def ensure_cache_dir(self) -> Path:
         """Create and return the temp script cache directory."""
@@ -92,26 +106,26 @@ class ConfigManager:
     def set_api_key(self, provider: str, key: str) -> None:
         """Store an API key in the OS keyring."""
         keyring.set_password(KEYRING_SERVICE, provider, key)
+        self._key_cache[provider] = key
 
     def get_api_key(self, provider: str) -> Optional[str]:
         """Retrieve an API key from the OS keyring."""
-        # Also check environment variables as a fallback
-        env_map = {
-            "openai": "OPENAI_API_KEY",
-            "anthropic": "ANTHROPIC_API_KEY",
-            "gemini": "GEMINI_API_KEY",
-        }
-        key = keyring.get_password(KEYRING_SERVICE, provider)
+        if provider not in self._key_cache:
+            self._key_cache[provider] = keyring.get_password(KEYRING_SERVICE, provider)
+        key = self._key_cache[provider]
         if key:
             return key
-        env_var = env_map.get(provider)
+        # Also check environment variables as a fallback
+        env_var = _ENV_VAR_MAP.get(provider)
         if env_var:
             return os.environ.get(env_var)
         return None
 
     def masked_config(self, config: ManimatorConfig) -> dict:
         """Return config as a dict with API keys masked."""
-        data = config.model_dump()
+        # Every field is a plain scalar, so a copy of __dict__ matches model_dump()
+        # without invoking the serializer. Switch back if a field ever needs it.
+        data = dict(config.__dict__)
         # Add masked key info
         key = self.get_api_key(config.provider)
         if key:
@@ -0,0 +1,26 @@
+"""Shared constants for manimator."""
+
+# Ordered tuples keep help text and error messages deterministic
+QUALITY_CHOICES_ORDERED = ("low", "medium", "high", "ultra")
+PROVIDERS_ORDERED = ("openai", "anthropic", "ollama", "gemini")
+
+# Frozensets for membership checks
+QUALITY_CHOICES = frozenset(QUALITY_CHOICES_ORDERED)
+VALID_PROVIDERS = frozenset(PROVIDERS_ORDERED)
+
+
+def validate_choice(value: str, name: str, choices: frozenset[str], ordered: tuple[str, ...]) -> str:
+    """
+    Return `value` normalised to lower case, or exit if it is not one of `choices`.
+
+    Matching is case-insensitive, so ``LOW`` is accepted as ``low``. `ordered`
+    lists the same values in the order the error message shows them.
+    """
+    normalized = value.casefold()
+    if normalized not in choices:
+        import typer
+        from manimator.utils.logger import log_error
+
+        log_error(f"Invalid {name} '{value}'. Choose from: {', '.join(ordered)}")
+        raise typer.Exit(1)
+    return normalized
@@ -1,7 +1,11 @@
 """Conversation history manager for manimator chat sessions."""
 
+import itertools
+import os
 import re
+from collections.abc import Sequence
 from pathlib import Path
+from typing import Optional
 
 
 # Common filler words to strip when generating slugs
@@ -11,6 +15,11 @@ _FILLER_WORDS = frozenset({
     "this", "from", "into", "about", "some", "very", "really",
 })
 
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9\s]")
+
+# Messages never trimmed from a capped history: the original request and its reply
+_KEPT_LEADING_MESSAGES = 2
+
 
 def generate_video_name(description: str) -> str:
     """
@@ -21,12 +30,10 @@ def generate_video_name(description: str) -> str:
         "Show the Pythagorean theorem with animation"  -> "pythagorean_theorem_animation"
     """
     # Lowercase, keep only alphanumeric and spaces
-    text = re.sub(r"[^a-z0-9\s]", "", description.lower())
-    words = text.split()
-    # Strip filler words
-    words = [w for w in words if w not in _FILLER_WORDS]
-    # Take up to 4 meaningful words
-    slug = "_".join(words[:4])
+    text = _SLUG_STRIP_RE.sub("", description.lower())
+    # Take up to 4 meaningful words, skipping filler and stopping once we have them
+    meaningful = (w for w in text.split() if w not in _FILLER_WORDS)
+    slug = "_".join(itertools.islice(meaningful, 4))
     return slug or "animation"
 
 
@@ -37,30 +44,62 @@ def generate_unique_filename(output_dir: Path, base_name: str, version: int) ->
     If the file already exists, increment the version until a free slot is found.
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    while True:
-        path = output_dir / f"{base_name}_v{version}.mp4"
-        if not path.exists():
-            return path
+    # One directory listing instead of a stat() per taken version
+    prefix = f"{base_name}_v"
+    taken = set()
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(".mp4"):
+                taken.add(name[len(prefix):-len(".mp4")])
+    while str(version) in taken:
         version += 1
+    return output_dir / f"{base_name}_v{version}.mp4"
 
 
 class ConversationManager:
     """Manages multi-turn conversation history for chat sessions."""
 
-    def __init__(self) -> None:
+    def __init__(self, max_messages: Optional[int] = None) -> None:
+        """
+        Args:
+            max_messages: Keep at most this many messages by dropping the oldest
+                follow-up exchanges. The first exchange is always kept, and the
+                cap may be exceeded by one message until the next user turn.
+                None keeps the full history.
+        """
         self._messages: list[dict] = []
+        self._max_messages = max_messages
 
     def add_user_message(self, content: str) -> None:
         """Append a user message to the conversation history."""
-        self._messages.append({"role": "user", "content": content})
+        self._append("user", content)
 
     def add_assistant_message(self, content: str) -> None:
         """Append an assistant (LLM) response to the conversation history."""
-        self._messages.append({"role": "assistant", "content": content})
+        self._append("assistant", content)
+
+    def _append(self, role: str, content: str) -> None:
+        self._messages.append({"role": role, "content": content})
+        if self._max_messages is not None and len(self._messages) > self._max_messages:
+            # Trim in place so `messages` views stay valid. The first exchange holds the
+            # original description, so it is kept and the oldest follow-ups go instead;
+            # the cut ends at a user turn so the remaining roles still alternate.
+            keep = _KEPT_LEADING_MESSAGES
+            drop_to = keep + len(self._messages) - self._max_messages
+            while drop_to < len(self._messages) and self._messages[drop_to]["role"] != "user":
+                drop_to += 1
+            if drop_to < len(self._messages):
+                del self._messages[keep:drop_to]
 
     def get_messages(self) -> list[dict]:
         """Return a copy of the full conversation message list."""
         return list(self._messages)
 
+    @property
+    def messages(self) -> Sequence[dict]:
+        """Read-only view of the message history, without copying it."""
+        return self._messages
+
     def __len__(self) -> int:
         return len(self._messages)
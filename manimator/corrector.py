@@ -1,6 +1,10 @@
 """Auto-correction loop for manimator."""
 
 import ast
+import functools
+import re
+import uuid
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Optional
 
@@ -21,6 +25,9 @@ from manimator.utils.logger import (
 )
 
 
+# The correction loop often sees the same code more than once, so both helpers
+# below are memoised to avoid re-parsing identical LLM output.
+@functools.lru_cache(maxsize=16)
 def _validate_python_syntax(code: str) -> tuple[bool, str]:
     """Check that the generated code is valid Python."""
     try:
@@ -30,14 +37,53 @@ def _validate_python_syntax(code: str) -> tuple[bool, str]:
         return False, f"SyntaxError at line {e.lineno}: {e.msg}"
 
 
+# Install hints for environment errors, checked in order; the first match wins.
+_DEPENDENCY_HINTS = (
+    (
+        re.compile(r"ffmpeg", re.IGNORECASE),
+        "Missing Dependency: ffmpeg",
+        "Install ffmpeg on Fedora:\n\n"
+        "  sudo dnf install ffmpeg\n\n"
+        "If ffmpeg is not in the default repos, enable RPM Fusion first:\n\n"
+        "  sudo dnf install https://mirrors.rpmfusion.org/free/fedora/"
+        "rpmfusion-free-release-$(rpm -E %fedora).noarch.rpm\n"
+        "  sudo dnf install ffmpeg",
+    ),
+    (
+        re.compile(r"latex", re.IGNORECASE),
+        "Missing Dependency: LaTeX",
+        "LaTeX is required by Manim for rendering math text.\n\n"
+        "Install on Fedora:\n\n"
+        "  sudo dnf install -y texlive-latex texlive-dvipng "
+        "texlive-amsmath texlive-standalone\n\n"
+        "Then re-run your command.",
+    ),
+    (
+        re.compile(r"\bmanim\b", re.IGNORECASE),
+        "Missing Dependency: manim",
+        "Install Manim with:\n\n  pip install manim\n\nThen re-run your command.",
+    ),
+)
+
+# Fed back to the LLM when a "correction" repeats code that already failed to render
+_REPEATED_CODE_ERROR = (
+    "The corrected code is identical to a previous attempt that already failed. "
+    "Try a different fix strategy.\n\nPrevious error:\n"
+)
+
+
+@functools.lru_cache(maxsize=16)
 def _extract_code_block(raw: str) -> str:
     """Strip markdown code fences if the LLM included them."""
     raw = raw.strip()
     if raw.startswith("```"):
-        lines = raw.splitlines()
-        # Remove first line (```python or ```) and last line (```)
-        inner = lines[1:-1] if lines[-1].strip() == "```" else lines[1:]
-        return "\n".join(inner).strip()
+        # Slice out everything between the opening fence line and a closing ``` line
+        first_nl = raw.find("\n")
+        if first_nl == -1:
+            return ""
+        last_nl = raw.rfind("\n")
+        end = last_nl if raw[last_nl + 1:].strip() == "```" else len(raw)
+        return raw[first_nl + 1:end].strip()
     return raw
 
 
@@ -67,9 +113,11 @@ class AutoCorrector:
         quality: str,
         output_dir: Path,
         output_filename: Optional[str] = None,
-    ) -> Optional[Path]:
+    ) -> tuple[Optional[Path], str]:
         """
-        Run the full pipeline. Returns the output .mp4 path on success, or None.
+        Run the full pipeline.
+
+        Returns (output_path, generated_code) — output_path is None on failure.
         """
         system_prompt = build_system_prompt(quality)
         user_prompt = build_user_prompt(description)
@@ -83,125 +131,38 @@ class AutoCorrector:
         code = self._generate_with_spinner(system_prompt, user_prompt, label="Generating Manim code")
         if not code:
             log_error("LLM returned empty response.")
-            return None
+            return None, ""
 
         code = _extract_code_block(code)
 
         if self._verbose:
             log_code(code, title="Generated Manim Code (attempt 1)")
 
-        # ── Correction loop ───────────────────────────────────────────────────
-        last_error = ""
-        for attempt in range(1, self._max_retries + 2):  # +1 for initial attempt
-            # Syntax check
-            valid, syntax_error = _validate_python_syntax(code)
-            if not valid:
-                last_error = syntax_error
-                log_warning(f"Syntax error detected: {syntax_error}")
-            else:
-                # Render
-                log_info(f"Rendering (attempt {attempt})…")
-                result: RenderResult = self._renderer.render(code, quality, output_dir, output_filename)
-
-                if result.success and result.output_path:
-                    console.print()
-                    log_success(f"Animation rendered successfully!")
-                    log_success(f"Output: [bold green]{result.output_path}[/bold green]")
-                    return result.output_path
-
-                last_error = result.error
-
-                # Fast-fail for environment errors — these can't be fixed by correcting code.
-                # The renderer tags these with "ENV_ERROR:" prefix.
-                if last_error.startswith("ENV_ERROR:"):
-                    console.print()
-                    clean_msg = last_error[len("ENV_ERROR:"):].strip()
-                    log_error(clean_msg)
-                    if "ffmpeg" in clean_msg.lower():
-                        log_panel(
-                            "Install ffmpeg on Fedora:\n\n"
-                            "  sudo dnf install ffmpeg\n\n"
-                            "If ffmpeg is not in the default repos, enable RPM Fusion first:\n\n"
-                            "  sudo dnf install https://mirrors.rpmfusion.org/free/fedora/"
-                            "rpmfusion-free-release-$(rpm -E %fedora).noarch.rpm\n"
-                            "  sudo dnf install ffmpeg",
-                            title="Missing Dependency: ffmpeg",
-                            style="red",
-                        )
-                    elif "latex" in clean_msg.lower():
-                        log_panel(
-                            "LaTeX is required by Manim for rendering math text.\n\n"
-                            "Install on Fedora:\n\n"
-                            "  sudo dnf install -y texlive-latex texlive-dvipng "
-                            "texlive-amsmath texlive-standalone\n\n"
-                            "Then re-run your command.",
-                            title="Missing Dependency: LaTeX",
-                            style="red",
-                        )
-                    elif "manim" in clean_msg.lower():
-                        log_panel(
-                            "Install Manim with:\n\n  pip install manim\n\nThen re-run your command.",
-                            title="Missing Dependency: manim",
-                            style="red",
-                        )
-                    else:
-                        log_panel(clean_msg, title="Environment Error", style="red")
-                    return None
-
-            # Check if we've exhausted retries
-            if attempt > self._max_retries:
-                break
-
-            # ── Auto-correction ───────────────────────────────────────────────
-            log_retry(attempt, self._max_retries, last_error[:500])
-
-            correction_prompt = build_correction_prompt(code, last_error)
-            corrected = self._generate_with_spinner(
-                system_prompt,
-                correction_prompt,
-                label=f"Auto-correcting (attempt {attempt}/{self._max_retries})",
-            )
-            if not corrected:
-                log_error("LLM returned empty correction response.")
-                break
-
-            code = _extract_code_block(corrected)
-
-            if self._verbose:
-                log_code(code, title=f"Corrected Code (attempt {attempt + 1})")
-
-        # ── All retries exhausted ─────────────────────────────────────────────
-        console.print()
-        log_error(f"Failed after {self._max_retries} correction attempt(s).")
-        log_panel(
-            last_error[-1000:] if len(last_error) > 1000 else last_error,
-            title="Last Error",
-            style="red",
-        )
-        console.print(
-            "\n[yellow]💡 Tip:[/yellow] Try simplifying your prompt, "
-            "or use [bold]--verbose[/bold] to inspect the generated code."
-        )
-        return None
+        return self._correction_loop(code, system_prompt, quality, output_dir, output_filename)
 
     def _generate_with_spinner(
         self, system_prompt: str, user_prompt: str, label: str
     ) -> str:
-        """Call the LLM provider with a Rich spinner."""
-        result = ""
+        """Stream code from the LLM provider behind a Rich spinner."""
+        chunks: list[str] = []
+        received = 0
         with Progress(
             SpinnerColumn(),
             TextColumn(f"[bold cyan]{label}…[/bold cyan]"),
+            TextColumn("[dim]{task.completed:.0f} chars[/dim]"),
             TimeElapsedColumn(),
             console=console,
             transient=True,
         ) as progress:
-            progress.add_task("", total=None)
-            result = self._provider.generate(system_prompt, user_prompt)
-        return result
+            task = progress.add_task("", total=None)
+            for chunk in self._provider.generate_stream(system_prompt, user_prompt):
+                chunks.append(chunk)
+                received += len(chunk)
+                progress.update(task, completed=received)
+        return "".join(chunks)
 
     def _generate_with_history_spinner(
-        self, system_prompt: str, messages: list[dict], label: str
+        self, system_prompt: str, messages: Sequence[dict], label: str
     ) -> str:
         """Call the LLM provider with conversation history and a Rich spinner."""
         result = ""
@@ -218,7 +179,7 @@ class AutoCorrector:
 
     def run_followup(
         self,
-        messages: list[dict],
+        messages: Sequence[dict],
         quality: str,
         output_dir: Path,
         output_filename: Optional[str] = None,
@@ -246,34 +207,72 @@ class AutoCorrector:
         if self._verbose:
             log_code(code, title="Generated Manim Code (follow-up)")
 
-        # Correction loop (same as run())
+        return self._correction_loop(code, system_prompt, quality, output_dir, output_filename)
+
+    def _correction_loop(
+        self,
+        code: str,
+        system_prompt: str,
+        quality: str,
+        output_dir: Path,
+        output_filename: Optional[str],
+    ) -> tuple[Optional[Path], str]:
+        """
+        Validate and render `code`, asking the LLM for corrections on failure.
+
+        Returns (output_path, final_code) — output_path is None on failure.
+        """
         last_error = ""
-        for attempt in range(1, self._max_retries + 2):
+        # Render errors keyed by the code that produced them; re-rendering is slow and deterministic
+        render_errors: dict[str, str] = {}
+        # Every attempt overwrites the same script instead of leaving one per retry
+        script_id = uuid.uuid4().hex[:8]
+        for attempt in range(1, self._max_retries + 2):  # +1 for initial attempt
+            # Syntax check
             valid, syntax_error = _validate_python_syntax(code)
             if not valid:
                 last_error = syntax_error
                 log_warning(f"Syntax error detected: {syntax_error}")
+            elif code in render_errors:
+                log_warning("LLM repeated code that already failed — skipping render.")
+                last_error = _REPEATED_CODE_ERROR + render_errors[code]
             else:
+                # Render
                 log_info(f"Rendering (attempt {attempt})…")
-                result: RenderResult = self._renderer.render(code, quality, output_dir, output_filename)
+                result: RenderResult = self._renderer.render(
+                    code, quality, output_dir, output_filename, script_id=script_id
+                )
 
                 if result.success and result.output_path:
                     console.print()
-                    log_success("Animation rendered successfully!")
+                    log_success(f"Animation rendered successfully!")
                     log_success(f"Output: [bold green]{result.output_path}[/bold green]")
                     return result.output_path, code
 
                 last_error = result.error
+                render_errors[code] = last_error
 
+                # Fast-fail for environment errors — these can't be fixed by correcting code.
+                # The renderer tags these with "ENV_ERROR:" prefix.
                 if last_error.startswith("ENV_ERROR:"):
+                    console.print()
                     clean_msg = last_error[len("ENV_ERROR:"):].strip()
                     log_error(clean_msg)
+                    for pattern, title, hint in _DEPENDENCY_HINTS:
+                        if pattern.search(clean_msg):
+                            log_panel(hint, title=title, style="red")
+                            break
+                    else:
+                        log_panel(clean_msg, title="Environment Error", style="red")
                     return None, code
 
+            # Check if we've exhausted retries
             if attempt > self._max_retries:
                 break
 
+            # ── Auto-correction ───────────────────────────────────────────────
             log_retry(attempt, self._max_retries, last_error[:500])
+
             correction_prompt = build_correction_prompt(code, last_error)
             corrected = self._generate_with_spinner(
                 system_prompt,
@@ -289,6 +288,7 @@ class AutoCorrector:
             if self._verbose:
                 log_code(code, title=f"Corrected Code (attempt {attempt + 1})")
 
+        # ── All retries exhausted ─────────────────────────────────────────────
         console.print()
         log_error(f"Failed after {self._max_retries} correction attempt(s).")
         log_panel(
@@ -296,4 +296,8 @@ class AutoCorrector:
             title="Last Error",
             style="red",
         )
+        console.print(
+            "\n[yellow]💡 Tip:[/yellow] Try simplifying your prompt, "
+            "or use [bold]--verbose[/bold] to inspect the generated code."
+        )
         return None, code
@@ -1,5 +1,24 @@
 """System and correction prompt construction for manimator."""
 
+
+def _split_template(template: str, *fields: str) -> tuple[str, ...]:
+    """
+    Split `template` into the literal text around its `{field}` placeholders.
+
+    Placeholders must appear exactly once and in the order given, so a prompt
+    can be built by plain concatenation instead of `str.format`.
+    """
+    parts = []
+    rest = template
+    for field in fields:
+        head, marker, rest = rest.partition("{" + field + "}")
+        if not marker:
+            raise ValueError(f"Placeholder {{{field}}} not found in template")
+        parts.append(head)
+    parts.append(rest)
+    return tuple(parts)
+
+
 SYSTEM_PROMPT_TEMPLATE = """\
 You are an expert Manim Community Edition (v0.18+) animator and Python developer.
 Your task is to generate a single, self-contained Python file that produces a mathematical animation.
@@ -43,6 +62,8 @@ QUALITY_HINTS = {
     "ultra": "Maximum quality — publication-grade detail, precise typography, complex multi-stage animation.",
 }
 
+_SYSTEM_PARTS = _split_template(SYSTEM_PROMPT_TEMPLATE, "quality", "quality_hint")
+
 CORRECTION_PROMPT_TEMPLATE = """\
 The Manim code you previously generated failed to render. Please fix it.
 
@@ -65,11 +86,14 @@ The Manim code you previously generated failed to render. Please fix it.
 - If the error mentions a missing attribute or method, use the correct Manim v0.18+ API
 """
 
+_CORRECTION_PARTS = _split_template(CORRECTION_PROMPT_TEMPLATE, "code", "error")
+
 
 def build_system_prompt(quality: str) -> str:
     """Build the system prompt for the initial code generation request."""
     hint = QUALITY_HINTS.get(quality, QUALITY_HINTS["medium"])
-    return SYSTEM_PROMPT_TEMPLATE.format(quality=quality.upper(), quality_hint=hint)
+    parts = _SYSTEM_PARTS
+    return parts[0] + quality.upper() + parts[1] + hint + parts[2]
 
 
 def build_user_prompt(description: str) -> str:
@@ -82,7 +106,8 @@ def build_user_prompt(description: str) -> str:
 
 def build_correction_prompt(code: str, error: str) -> str:
     """Build the correction prompt when Manim rendering fails."""
-    return CORRECTION_PROMPT_TEMPLATE.format(code=code, error=error)
+    parts = _CORRECTION_PARTS
+    return parts[0] + code + parts[1] + error + parts[2]
 
 
 FOLLOWUP_PROMPT_TEMPLATE = """\
@@ -104,10 +129,11 @@ The user wants to modify the existing Manim animation. Here is the current worki
 - Ensure all imports are from `manim`, not `manimlib`
 """
 
+_FOLLOWUP_PARTS = _split_template(FOLLOWUP_PROMPT_TEMPLATE, "code", "change_request")
+
 
 def build_followup_prompt(change_request: str, previous_code: str) -> str:
     """Build the prompt for a follow-up change request."""
-    return FOLLOWUP_PROMPT_TEMPLATE.format(
-        code=previous_code, change_request=change_request
-    )
+    parts = _FOLLOWUP_PARTS
+    return parts[0] + previous_code + parts[1] + change_request + parts[2]
 
@@ -1,63 +1,123 @@
 """Anthropic LLM provider for manimator."""
 
-import anthropic
-
-from manimator.providers.base import LLMProvider
-
-ANTHROPIC_MODELS = [
-    {
-        "name": "claude-opus-4-5",
-        "context": "200k tokens",
-        "speed": "Powerful",
-        "description": "Most capable Claude model — best for complex animations",
-    },
-    {
-        "name": "claude-sonnet-4-5",
-        "context": "200k tokens",
-        "speed": "Balanced",
-        "description": "Great balance of intelligence and speed",
-    },
-    {
-        "name": "claude-haiku-4-5",
-        "context": "200k tokens",
-        "speed": "Fast",
-        "description": "Fastest Claude model — ideal for quick iterations",
-    },
-    {
-        "name": "claude-3-5-sonnet-20241022",
-        "context": "200k tokens",
-        "speed": "Balanced",
-        "description": "Stable Sonnet 3.5 release with strong code generation",
-    },
-]
+from collections.abc import Iterator, Sequence
+
+from manimator.providers.base import LLMProvider, ModelSpec
+
+ANTHROPIC_MODELS: tuple[ModelSpec, ...] = (
+    ModelSpec(
+        name="claude-opus-4-5",
+        context="200k tokens",
+        speed="Powerful",
+        description="Most capable Claude model — best for complex animations",
+    ),
+    ModelSpec(
+        name="claude-sonnet-4-5",
+        context="200k tokens",
+        speed="Balanced",
+        description="Great balance of intelligence and speed",
+    ),
+    ModelSpec(
+        name="claude-haiku-4-5",
+        context="200k tokens",
+        speed="Fast",
+        description="Fastest Claude model — ideal for quick iterations",
+    ),
+    ModelSpec(
+        name="claude-3-5-sonnet-20241022",
+        context="200k tokens",
+        speed="Balanced",
+        description="Stable Sonnet 3.5 release with strong code generation",
+    ),
+)
+
+
+# Prompt-caching marker: the request prefix up to this block is cached server-side,
+# so retries and follow-ups that resend the same system prompt and history reuse it.
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def _cached_system(system_prompt: str) -> list[dict]:
+    """Return the system prompt as a single text block marked for prompt caching."""
+    return [{"type": "text", "text": system_prompt, "cache_control": _CACHE_CONTROL}]
+
+
+def _with_cache_breakpoint(messages: Sequence[dict]) -> list[dict]:
+    """
+    Mark the last message so the conversation so far is cached for the next turn.
+
+    Messages are copied; the caller's history is left untouched.
+    """
+    marked = list(messages)
+    if marked:
+        last = marked[-1]
+        marked[-1] = {
+            "role": last["role"],
+            "content": [{"type": "text", "text": last["content"], "cache_control": _CACHE_CONTROL}],
+        }
+    return marked
 
 
 class AnthropicProvider(LLMProvider):
     """LLM provider backed by the Anthropic API."""
 
     def __init__(self, api_key: str, model: str = "claude-sonnet-4-5") -> None:
+        import anthropic  # Deferred so reading ANTHROPIC_MODELS does not load the SDK
+
+        self._api_key = api_key
         self._client = anthropic.Anthropic(api_key=api_key)
+        self._async_client = None  # Created on first async call
         self._model = model
 
+    def _get_async_client(self):
+        if self._async_client is None:
+            import anthropic
+
+            self._async_client = anthropic.AsyncAnthropic(api_key=self._api_key)
+        return self._async_client
+
     def generate(self, system_prompt: str, user_prompt: str) -> str:
         message = self._client.messages.create(
             model=self._model,
             max_tokens=4096,
-            system=system_prompt,
+            system=_cached_system(system_prompt),
             messages=[
                 {"role": "user", "content": user_prompt},
             ],
         )
         return message.content[0].text if message.content else ""
 
-    def generate_with_history(self, system_prompt: str, messages: list[dict]) -> str:
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        with self._client.messages.stream(
+            model=self._model,
+            max_tokens=4096,
+            system=_cached_system(system_prompt),
+            messages=[
+                {"role": "user", "content": user_prompt},
+            ],
+        ) as stream:
+            yield from stream.text_stream
+
+    def generate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
         message = self._client.messages.create(
             model=self._model,
             max_tokens=4096,
-            system=system_prompt,
-            messages=messages,
+            system=_cached_system(system_prompt),
+            messages=_with_cache_breakpoint(messages),
+        )
+        return message.content[0].text if message.content else ""
+
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> str:
+        return await self.agenerate_with_history(system_prompt, [{"role": "user", "content": user_prompt}])
+
+    async def agenerate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
+        message = await self._get_async_client().messages.create(
+            model=self._model,
+            max_tokens=4096,
+            system=_cached_system(system_prompt),
+            messages=_with_cache_breakpoint(messages),
         )
         return message.content[0].text if message.content else ""
 
-    def list_models(self) -> list[dict]:
+    def list_models(self) -> Sequence[ModelSpec]:
         return ANTHROPIC_MODELS
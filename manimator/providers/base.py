@@ -1,12 +1,52 @@
-"""Abstract LLM provider interface for manimator."""
+"""LLM provider interface for manimator."""
 
-from abc import ABC, abstractmethod
+import re
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from typing import Optional
 
+# Most prompts marshalled into a single generate_batch() request
+MAX_BATCH_SIZE = 4
 
-class LLMProvider(ABC):
-    """Base class for all LLM providers."""
+_ANSWER_RE = re.compile(r"<ANSWER (\d+)>(.*?)</ANSWER \1>", re.DOTALL)
+
+
+def _marshal_batch(user_prompts: Sequence[str]) -> str:
+    """Combine several prompts into one request with numbered task/answer tags."""
+    tasks = "\n".join(f"<TASK {i}>\n{p}\n</TASK {i}>" for i, p in enumerate(user_prompts, 1))
+    return (
+        f"Complete each of the {len(user_prompts)} tasks below independently. "
+        "Wrap the answer to task i in <ANSWER i>…</ANSWER i> and output nothing else.\n\n"
+        + tasks
+    )
+
+
+def _unmarshal_batch(response: str, count: int) -> list[Optional[str]]:
+    """Split a marshalled response into `count` answers; missing answers are None."""
+    answers = {int(i): text.strip() for i, text in _ANSWER_RE.findall(response)}
+    return [answers.get(i) for i in range(1, count + 1)]
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """Metadata for one model shown by `manimator list-models`."""
+
+    __slots__ = ("name", "context", "speed", "description")
+
+    name: str
+    context: str  # e.g. "128k tokens"
+    speed: str  # e.g. "Balanced"
+    description: str
+
+
+class LLMProvider:
+    """
+    Base class for all LLM providers.
+
+    Subclasses must implement generate() and list_models(). This is a plain
+    class rather than an ABC so constructing a provider skips ABCMeta's checks.
+    """
 
-    @abstractmethod
     def generate(self, system_prompt: str, user_prompt: str) -> str:
         """
         Generate Manim Python code from the given prompts.
@@ -18,15 +58,24 @@ class LLMProvider(ABC):
         Returns:
             A string containing the generated (or corrected) Python code.
         """
-        ...
+        raise NotImplementedError
+
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        """
+        Generate Manim code as a stream of text chunks.
 
-    def generate_with_history(self, system_prompt: str, messages: list[dict]) -> str:
+        Default implementation yields the complete generate() result as one chunk;
+        providers whose SDK supports streaming override this.
+        """
+        yield self.generate(system_prompt, user_prompt)
+
+    def generate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
         """
         Generate Manim code using full conversation history.
 
         Args:
             system_prompt: The system-level instructions for the LLM.
-            messages: A list of {"role": "user"|"assistant", "content": "..."} dicts.
+            messages: A sequence of {"role": "user"|"assistant", "content": "..."} dicts.
 
         Returns:
             A string containing the generated (or corrected) Python code.
@@ -38,15 +87,51 @@ class LLMProvider(ABC):
         )
         return self.generate(system_prompt, last_user)
 
-    @abstractmethod
-    def list_models(self) -> list[dict]:
+    def generate_batch(self, system_prompt: str, user_prompts: Sequence[str]) -> list[str]:
+        """
+        Generate a response for each prompt using as few requests as possible.
+
+        Up to MAX_BATCH_SIZE prompts are combined into one generate() call and
+        the answers split back out, in prompt order. Any prompt the model left
+        unanswered is re-run on its own with generate().
+        """
+        results: list[str] = []
+        for start in range(0, len(user_prompts), MAX_BATCH_SIZE):
+            chunk = user_prompts[start:start + MAX_BATCH_SIZE]
+            if len(chunk) == 1:
+                results.append(self.generate(system_prompt, chunk[0]))
+            else:
+                response = self.generate(system_prompt, _marshal_batch(chunk))
+                answers = _unmarshal_batch(response, len(chunk))
+                results.extend(
+                    self.generate(system_prompt, prompt) if answer is None else answer
+                    for prompt, answer in zip(chunk, answers)
+                )
+        return results
+
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> str:
         """
-        Return a list of available models with metadata.
+        Async variant of generate().
 
-        Each dict should contain:
-            - name: str
-            - context: str  (e.g. "128k tokens")
-            - speed: str    (e.g. "Balanced")
-            - description: str
+        Default implementation runs generate() in a worker thread; providers
+        with an async SDK override this.
         """
-        ...
+        import asyncio
+
+        return await asyncio.to_thread(self.generate, system_prompt, user_prompt)
+
+    async def agenerate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
+        """Async variant of generate_with_history(), run in a worker thread by default."""
+        import asyncio
+
+        return await asyncio.to_thread(self.generate_with_history, system_prompt, messages)
+
+    async def abatch(self, system_prompt: str, user_prompts: Sequence[str]) -> list[str]:
+        """Generate a response for each prompt concurrently, in prompt order."""
+        import asyncio
+
+        return list(await asyncio.gather(*(self.agenerate(system_prompt, p) for p in user_prompts)))
+
+    def list_models(self) -> Sequence[ModelSpec]:
+        """Return the available models with their metadata."""
+        raise NotImplementedError
@@ -0,0 +1,155 @@
+"""On-disk cache of LLM responses for manimator providers."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import Any, Optional
+
+from manimator.providers.base import LLMProvider, ModelSpec
+
+# Cached responses are served for a day; older rows are ignored and overwritten
+RESPONSE_CACHE_TTL = 24 * 60 * 60
+
+
+class LLMCache:
+    """
+    SQLite-backed store of LLM responses keyed by a hash of the request.
+
+    The cache is best-effort: database errors are treated as misses so a
+    locked or corrupt cache file never breaks generation. One connection is
+    shared by all threads (agenerate and abatch call in from workers), with
+    every use serialised by a lock.
+    """
+
+    def __init__(self, path: Path, ttl: float = RESPONSE_CACHE_TTL) -> None:
+        self._path = path
+        self._ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Return a stable SHA-256 key for the given request parts."""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at INTEGER NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for `key`, or None if missing or expired."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT response FROM responses WHERE key = ? AND created_at > ?",
+                    (key, int(time.time() - self._ttl)),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, response: str) -> None:
+        """Store `response` under `key`."""
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, response, int(time.time())),
+                )
+        except sqlite3.Error:
+            pass  # Caching is best-effort
+
+
+class CachingProvider(LLMProvider):
+    """
+    Wrap a provider so identical requests are answered from an LLMCache.
+
+    Keys cover the wrapped provider class and model plus the full prompt, so
+    switching either never returns another model's answer. Empty responses
+    are not cached.
+    """
+
+    def __init__(self, provider: LLMProvider, cache: LLMCache) -> None:
+        self._provider = provider
+        self._cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        # Anything not overridden here (e.g. provider-specific helpers) goes to the wrapped provider
+        return getattr(self._provider, name)
+
+    def _key(self, **parts: Any) -> str:
+        return LLMCache.make_key(
+            provider=type(self._provider).__name__,
+            model=getattr(self._provider, "_model", None),
+            **parts,
+        )
+
+    def generate(self, system_prompt: str, user_prompt: str) -> str:
+        key = self._key(system=system_prompt, user=user_prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        response = self._provider.generate(system_prompt, user_prompt)
+        if response:
+            self._cache.set(key, response)
+        return response
+
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        # Shares its key with generate(): both return the same text for the same prompts
+        key = self._key(system=system_prompt, user=user_prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        chunks: list[str] = []
+        for chunk in self._provider.generate_stream(system_prompt, user_prompt):
+            chunks.append(chunk)
+            yield chunk
+        response = "".join(chunks)
+        if response:
+            self._cache.set(key, response)
+
+    def generate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
+        key = self._key(system=system_prompt, messages=list(messages))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        response = self._provider.generate_with_history(system_prompt, messages)
+        if response:
+            self._cache.set(key, response)
+        return response
+
+    def generate_batch(self, system_prompt: str, user_prompts: Sequence[str]) -> list[str]:
+        """
+        Answer cached prompts from the cache and forward the rest as one batch.
+
+        Each answer is cached under the same key as generate(). A batch that
+        repeats a prompt asks for distinct samples of it, so it bypasses the cache.
+        """
+        if len(set(user_prompts)) < len(user_prompts):
+            return self._provider.generate_batch(system_prompt, user_prompts)
+        keys = [self._key(system=system_prompt, user=p) for p in user_prompts]
+        results = [self._cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            fresh = self._provider.generate_batch(system_prompt, [user_prompts[i] for i in missing])
+            for i, response in zip(missing, fresh):
+                results[i] = response
+                if response:
+                    self._cache.set(keys[i], response)
+        return results
+
+    def list_models(self) -> Sequence[ModelSpec]:
+        return self._provider.list_models()
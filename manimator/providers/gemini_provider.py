@@ -1,79 +1,134 @@
 """Google Gemini LLM provider for manimator."""
 
-from google import genai
-from google.genai import types
-
-from manimator.providers.base import LLMProvider
-
-GEMINI_MODELS = [
-    {
-        "name": "gemini-2.5-pro-preview-06-05",
-        "context": "1M tokens",
-        "speed": "Powerful",
-        "description": "Most capable Gemini model — best for complex animations",
-    },
-    {
-        "name": "gemini-2.5-flash-preview-04-17",
-        "context": "1M tokens",
-        "speed": "Fast",
-        "description": "Fast and efficient — great balance for most animations",
-    },
-    {
-        "name": "gemini-2.0-flash",
-        "context": "1M tokens",
-        "speed": "Very Fast",
-        "description": "Gemini 2.0 Flash — excellent speed with strong code generation",
-    },
-    {
-        "name": "gemini-1.5-pro",
-        "context": "2M tokens",
-        "speed": "Balanced",
-        "description": "Stable Gemini 1.5 Pro with massive context window",
-    },
-    {
-        "name": "gemini-1.5-flash",
-        "context": "1M tokens",
-        "speed": "Fast",
-        "description": "Lightweight Gemini 1.5 — fast and cost-efficient",
-    },
-]
+import functools
+from collections.abc import Iterator, Sequence
+
+from manimator.providers.base import LLMProvider, ModelSpec
+
+GEMINI_MODELS: tuple[ModelSpec, ...] = (
+    ModelSpec(
+        name="gemini-2.5-pro-preview-06-05",
+        context="1M tokens",
+        speed="Powerful",
+        description="Most capable Gemini model — best for complex animations",
+    ),
+    ModelSpec(
+        name="gemini-2.5-flash-preview-04-17",
+        context="1M tokens",
+        speed="Fast",
+        description="Fast and efficient — great balance for most animations",
+    ),
+    ModelSpec(
+        name="gemini-2.0-flash",
+        context="1M tokens",
+        speed="Very Fast",
+        description="Gemini 2.0 Flash — excellent speed with strong code generation",
+    ),
+    ModelSpec(
+        name="gemini-1.5-pro",
+        context="2M tokens",
+        speed="Balanced",
+        description="Stable Gemini 1.5 Pro with massive context window",
+    ),
+    ModelSpec(
+        name="gemini-1.5-flash",
+        context="1M tokens",
+        speed="Fast",
+        description="Lightweight Gemini 1.5 — fast and cost-efficient",
+    ),
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str):
+    """Return a shared Gemini client for `api_key` so its HTTP connection pool is reused."""
+    from google import genai  # Deferred so reading GEMINI_MODELS does not load the SDK
+
+    return genai.Client(api_key=api_key)
 
 
 class GeminiProvider(LLMProvider):
     """LLM provider backed by the Google Gemini API."""
 
     def __init__(self, api_key: str, model: str = "gemini-2.5-flash-preview-04-17") -> None:
-        self._client = genai.Client(api_key=api_key)
+        self._client = _get_client(api_key)
         self._model = model
+        # (message, its content, converted Content) for the last history seen
+        self._converted: list[tuple[dict, str, object]] = []
+
+    @staticmethod
+    def _config(system_prompt: str):
+        from google.genai import types
+
+        return types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            temperature=0.2,
+            max_output_tokens=8192,
+        )
+
+    def _contents(self, messages: Sequence[dict]) -> list:
+        """
+        Convert chat messages to Gemini content parts.
+
+        Conversations only grow between calls, so the converted prefix is kept and
+        only new messages are converted. Any change to the prefix rebuilds it.
+        """
+        from google.genai import types
+
+        cached = self._converted
+        n = len(cached)
+        if len(messages) < n or any(
+            msg is not src or msg["content"] is not text
+            for msg, (src, text, _) in zip(messages, cached)
+        ):
+            cached.clear()
+            n = 0
+        for msg in messages[n:]:
+            role = "model" if msg["role"] == "assistant" else "user"
+            content = types.Content(role=role, parts=[types.Part(text=msg["content"])])
+            cached.append((msg, msg["content"], content))
+        return [content for _, _, content in cached]
 
     def generate(self, system_prompt: str, user_prompt: str) -> str:
         response = self._client.models.generate_content(
             model=self._model,
             contents=user_prompt,
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                temperature=0.2,
-                max_output_tokens=8192,
-            ),
+            config=self._config(system_prompt),
         )
         return response.text or ""
 
-    def generate_with_history(self, system_prompt: str, messages: list[dict]) -> str:
-        # Convert messages to Gemini content parts
-        contents = []
-        for msg in messages:
-            role = "model" if msg["role"] == "assistant" else "user"
-            contents.append(types.Content(role=role, parts=[types.Part(text=msg["content"])]))
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        for chunk in self._client.models.generate_content_stream(
+            model=self._model,
+            contents=user_prompt,
+            config=self._config(system_prompt),
+        ):
+            if chunk.text:
+                yield chunk.text
+
+    def generate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
         response = self._client.models.generate_content(
             model=self._model,
-            contents=contents,
-            config=types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                temperature=0.2,
-                max_output_tokens=8192,
-            ),
+            contents=self._contents(messages),
+            config=self._config(system_prompt),
+        )
+        return response.text or ""
+
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> str:
+        response = await self._client.aio.models.generate_content(
+            model=self._model,
+            contents=user_prompt,
+            config=self._config(system_prompt),
+        )
+        return response.text or ""
+
+    async def agenerate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
+        response = await self._client.aio.models.generate_content(
+            model=self._model,
+            contents=self._contents(messages),
+            config=self._config(system_prompt),
         )
         return response.text or ""
 
-    def list_models(self) -> list[dict]:
+    def list_models(self) -> Sequence[ModelSpec]:
         return GEMINI_MODELS
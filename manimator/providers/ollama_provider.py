@@ -1,52 +1,145 @@
 """Ollama local LLM provider for manimator."""
 
-import json
-from typing import Any
-from urllib.request import urlopen, Request
+import http.client
+import threading
+from collections.abc import Iterator, Sequence
+from typing import Any, Optional
 from urllib.error import URLError
+from urllib.parse import urlsplit
 
-from manimator.providers.base import LLMProvider
+from manimator.providers.base import LLMProvider, ModelSpec
+from manimator.utils import fastjson
 
 OLLAMA_BASE_URL = "http://localhost:11434"
 
-OLLAMA_RECOMMENDED_MODELS = [
-    {
-        "name": "codellama:latest",
-        "context": "16k tokens",
-        "speed": "Fast",
-        "description": "Code-specialized Llama model — great for Manim code generation",
-    },
-    {
-        "name": "llama3:latest",
-        "context": "8k tokens",
-        "speed": "Fast",
-        "description": "General-purpose Llama 3 — good all-rounder",
-    },
-    {
-        "name": "mistral:latest",
-        "context": "32k tokens",
-        "speed": "Fast",
-        "description": "Mistral 7B — fast and capable for code tasks",
-    },
-    {
-        "name": "deepseek-coder:latest",
-        "context": "16k tokens",
-        "speed": "Fast",
-        "description": "DeepSeek Coder — excellent for Python code generation",
-    },
-]
+OLLAMA_RECOMMENDED_MODELS: tuple[ModelSpec, ...] = (
+    ModelSpec(
+        name="codellama:latest",
+        context="16k tokens",
+        speed="Fast",
+        description="Code-specialized Llama model — great for Manim code generation",
+    ),
+    ModelSpec(
+        name="llama3:latest",
+        context="8k tokens",
+        speed="Fast",
+        description="General-purpose Llama 3 — good all-rounder",
+    ),
+    ModelSpec(
+        name="mistral:latest",
+        context="32k tokens",
+        speed="Fast",
+        description="Mistral 7B — fast and capable for code tasks",
+    ),
+    ModelSpec(
+        name="deepseek-coder:latest",
+        context="16k tokens",
+        speed="Fast",
+        description="DeepSeek Coder — excellent for Python code generation",
+    ),
+)
 
 
-def _ollama_request(path: str, payload: dict[str, Any] | None = None) -> Any:
-    """Make a request to the local Ollama API."""
-    url = f"{OLLAMA_BASE_URL}{path}"
+# One keep-alive connection to Ollama per thread, reused across that thread's requests.
+# Threaded callers (agenerate, abatch workers) each get their own and run concurrently.
+_local = threading.local()
+
+
+def _new_connection() -> http.client.HTTPConnection:
+    parts = urlsplit(OLLAMA_BASE_URL)
+    return http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=120)
+
+
+def _get_connection() -> http.client.HTTPConnection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = _new_connection()
+    return conn
+
+
+def _close_connection() -> None:
+    """Close the calling thread's connection, if it has one."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
+def _send(path: str, payload: Optional[dict[str, Any]]) -> http.client.HTTPResponse:
+    """
+    Send a request on this thread's connection and return the response, unread.
+
+    Connection failures are raised as URLError.
+    """
+    method, body, headers = _request_args(payload)
+    while True:
+        reused = getattr(_local, "conn", None) is not None
+        conn = _get_connection()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+            break
+        except (BrokenPipeError, ConnectionResetError) as e:
+            _close_connection()
+            if not reused:
+                raise URLError(e) from e
+            # Ollama closed the idle keep-alive socket; retry once on a fresh one
+        except (OSError, http.client.HTTPException) as e:
+            _close_connection()
+            raise URLError(e) from e
+
+    _check_status(resp, path)
+    return resp
+
+
+def _request_args(payload: Optional[dict[str, Any]]) -> tuple[str, Optional[bytes], dict[str, str]]:
+    """Return (method, body, headers): a JSON POST for a payload, else a GET."""
     if payload is not None:
-        data = json.dumps(payload).encode("utf-8")
-        req = Request(url, data=data, headers={"Content-Type": "application/json"})
-    else:
-        req = Request(url)
-    with urlopen(req, timeout=120) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+        return "POST", fastjson.dumps(payload), {"Content-Type": "application/json"}
+    return "GET", None, {}
+
+
+def _check_status(resp: http.client.HTTPResponse, path: str) -> None:
+    if resp.status >= 400:
+        resp.read()
+        raise URLError(f"Ollama returned HTTP {resp.status} for {path}")
+
+
+def _ollama_request(path: str, payload: dict[str, Any] | None = None) -> Any:
+    """Make a request to the local Ollama API over this thread's persistent connection."""
+    resp = _send(path, payload)
+    try:
+        data = resp.read()
+    except (OSError, http.client.HTTPException) as e:
+        _close_connection()
+        raise URLError(e) from e
+    return fastjson.loads(data)
+
+
+def _ollama_stream(path: str, payload: dict[str, Any]) -> Iterator[Any]:
+    """
+    Make a streaming request and yield each NDJSON event as it arrives.
+
+    The response is read lazily while the caller consumes events, so it gets a
+    connection of its own: the thread's keep-alive connection stays free for
+    other requests, even if the stream is abandoned partway.
+    """
+    method, body, headers = _request_args(payload)
+    conn = _new_connection()
+    try:
+        conn.request(method, path, body=body, headers=headers)
+        resp = conn.getresponse()
+        _check_status(resp, path)
+        for line in resp:
+            if line.strip():
+                yield fastjson.loads(line)
+    except (OSError, http.client.HTTPException) as e:
+        raise URLError(e) from e
+    finally:
+        conn.close()
+
+
+_CONNECT_ERROR = "Cannot connect to Ollama at {url}. Make sure Ollama is running: `ollama serve`"
 
 
 class OllamaProvider(LLMProvider):
@@ -55,43 +148,36 @@ class OllamaProvider(LLMProvider):
     def __init__(self, model: str = "codellama:latest") -> None:
         self._model = model
 
-    def generate(self, system_prompt: str, user_prompt: str) -> str:
-        payload = {
+    def _chat_payload(self, system_prompt: str, messages: Sequence[dict], stream: bool) -> dict:
+        return {
             "model": self._model,
-            "messages": [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            "stream": False,
+            "messages": [{"role": "system", "content": system_prompt}, *messages],
+            "stream": stream,
             "options": {"temperature": 0.2},
         }
+
+    def generate(self, system_prompt: str, user_prompt: str) -> str:
+        return self.generate_with_history(system_prompt, [{"role": "user", "content": user_prompt}])
+
+    def generate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
+        payload = self._chat_payload(system_prompt, messages, stream=False)
         try:
             response = _ollama_request("/api/chat", payload)
             return response.get("message", {}).get("content", "")
         except URLError as e:
-            raise RuntimeError(
-                f"Cannot connect to Ollama at {OLLAMA_BASE_URL}. "
-                "Make sure Ollama is running: `ollama serve`"
-            ) from e
-
-    def generate_with_history(self, system_prompt: str, messages: list[dict]) -> str:
-        full_messages = [{"role": "system", "content": system_prompt}] + messages
-        payload = {
-            "model": self._model,
-            "messages": full_messages,
-            "stream": False,
-            "options": {"temperature": 0.2},
-        }
+            raise RuntimeError(_CONNECT_ERROR.format(url=OLLAMA_BASE_URL)) from e
+
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        payload = self._chat_payload(system_prompt, [{"role": "user", "content": user_prompt}], stream=True)
         try:
-            response = _ollama_request("/api/chat", payload)
-            return response.get("message", {}).get("content", "")
+            for event in _ollama_stream("/api/chat", payload):
+                text = event.get("message", {}).get("content", "")
+                if text:
+                    yield text
         except URLError as e:
-            raise RuntimeError(
-                f"Cannot connect to Ollama at {OLLAMA_BASE_URL}. "
-                "Make sure Ollama is running: `ollama serve`"
-            ) from e
+            raise RuntimeError(_CONNECT_ERROR.format(url=OLLAMA_BASE_URL)) from e
 
-    def list_models(self) -> list[dict]:
+    def list_models(self) -> Sequence[ModelSpec]:
         """Query Ollama for locally available models."""
         try:
             response = _ollama_request("/api/tags")
@@ -102,12 +188,12 @@ class OllamaProvider(LLMProvider):
                 size_bytes = m.get("size", 0)
                 size_gb = f"{size_bytes / 1e9:.1f}GB" if size_bytes else "?"
                 result.append(
-                    {
-                        "name": name,
-                        "context": "varies",
-                        "speed": "Local",
-                        "description": f"Local model ({size_gb})",
-                    }
+                    ModelSpec(
+                        name=name,
+                        context="varies",
+                        speed="Local",
+                        description=f"Local model ({size_gb})",
+                    )
                 )
             return result if result else OLLAMA_RECOMMENDED_MODELS
         except URLError:
@@ -1,65 +1,104 @@
 """OpenAI LLM provider for manimator."""
 
-from openai import OpenAI
-
-from manimator.providers.base import LLMProvider
-
-OPENAI_MODELS = [
-    {
-        "name": "gpt-4o",
-        "context": "128k tokens",
-        "speed": "Balanced",
-        "description": "Best overall — fast, smart, great at code generation",
-    },
-    {
-        "name": "gpt-4-turbo",
-        "context": "128k tokens",
-        "speed": "Balanced",
-        "description": "High-capability model with large context window",
-    },
-    {
-        "name": "gpt-4o-mini",
-        "context": "128k tokens",
-        "speed": "Fast",
-        "description": "Lightweight and cost-efficient for simpler animations",
-    },
-    {
-        "name": "gpt-3.5-turbo",
-        "context": "16k tokens",
-        "speed": "Very Fast",
-        "description": "Fastest and cheapest; best for simple scenes",
-    },
-]
+import functools
+from collections.abc import Iterator, Sequence
+
+from manimator.providers.base import MAX_BATCH_SIZE, LLMProvider, ModelSpec
+
+OPENAI_MODELS: tuple[ModelSpec, ...] = (
+    ModelSpec(
+        name="gpt-4o",
+        context="128k tokens",
+        speed="Balanced",
+        description="Best overall — fast, smart, great at code generation",
+    ),
+    ModelSpec(
+        name="gpt-4-turbo",
+        context="128k tokens",
+        speed="Balanced",
+        description="High-capability model with large context window",
+    ),
+    ModelSpec(
+        name="gpt-4o-mini",
+        context="128k tokens",
+        speed="Fast",
+        description="Lightweight and cost-efficient for simpler animations",
+    ),
+    ModelSpec(
+        name="gpt-3.5-turbo",
+        context="16k tokens",
+        speed="Very Fast",
+        description="Fastest and cheapest; best for simple scenes",
+    ),
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str):
+    """
+    Return a shared OpenAI client for `api_key`.
+
+    The SDK keeps a pooled keep-alive HTTP connection per client, so reusing the
+    client across provider instances avoids a fresh TLS handshake for each one.
+    """
+    from openai import OpenAI  # Deferred so reading OPENAI_MODELS does not load the SDK
+
+    return OpenAI(api_key=api_key)
 
 
 class OpenAIProvider(LLMProvider):
     """LLM provider backed by the OpenAI API."""
 
     def __init__(self, api_key: str, model: str = "gpt-4o") -> None:
-        self._client = OpenAI(api_key=api_key)
+        self._api_key = api_key
+        self._client = _get_client(api_key)
+        self._async_client = None  # Created on first async call
         self._model = model
 
+    def _completion_kwargs(self, system_prompt: str, messages: Sequence[dict]) -> dict:
+        return {
+            "model": self._model,
+            "messages": [{"role": "system", "content": system_prompt}, *messages],
+            "temperature": 0.2,
+            "max_tokens": 4096,
+        }
+
+    def _get_async_client(self):
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+
+            self._async_client = AsyncOpenAI(api_key=self._api_key)
+        return self._async_client
+
     def generate(self, system_prompt: str, user_prompt: str) -> str:
-        response = self._client.chat.completions.create(
-            model=self._model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.2,
-            max_tokens=4096,
-        )
+        return self.generate_with_history(system_prompt, [{"role": "user", "content": user_prompt}])
+
+    def generate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
+        response = self._client.chat.completions.create(**self._completion_kwargs(system_prompt, messages))
         return response.choices[0].message.content or ""
 
-    def generate_with_history(self, system_prompt: str, messages: list[dict]) -> str:
-        full_messages = [{"role": "system", "content": system_prompt}] + messages
-        response = self._client.chat.completions.create(
-            model=self._model,
-            messages=full_messages,
-            temperature=0.2,
-            max_tokens=4096,
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        kwargs = self._completion_kwargs(system_prompt, [{"role": "user", "content": user_prompt}])
+        for chunk in self._client.chat.completions.create(**kwargs, stream=True):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def generate_batch(self, system_prompt: str, user_prompts: Sequence[str]) -> list[str]:
+        # Variants of one prompt map onto the API's native n= sampling
+        if 1 < len(user_prompts) <= MAX_BATCH_SIZE and len(set(user_prompts)) == 1:
+            kwargs = self._completion_kwargs(system_prompt, [{"role": "user", "content": user_prompts[0]}])
+            response = self._client.chat.completions.create(**kwargs, n=len(user_prompts))
+            return [choice.message.content or "" for choice in response.choices]
+        return super().generate_batch(system_prompt, user_prompts)
+
+    async def agenerate(self, system_prompt: str, user_prompt: str) -> str:
+        return await self.agenerate_with_history(system_prompt, [{"role": "user", "content": user_prompt}])
+
+    async def agenerate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
+        response = await self._get_async_client().chat.completions.create(
+            **self._completion_kwargs(system_prompt, messages)
         )
         return response.choices[0].message.content or ""
 
-    def list_models(self) -> list[dict]:
+    def list_models(self) -> Sequence[ModelSpec]:
         return OPENAI_MODELS
@@ -1,24 +1,42 @@
 """Manim subprocess renderer for manimator."""
 
+import os
 import re
+import shutil
 import subprocess
 import tempfile
+import threading
 import uuid
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
 from manimator.utils.logger import console, log_info, log_error
 
-# Map quality names to Manim CLI flags
-QUALITY_FLAGS: dict[str, str] = {
-    "low": "-ql",
-    "medium": "-qm",
-    "high": "-qh",
-    "ultra": "-qk",
+# Map quality names to (Manim CLI flag, resolution directory Manim renders into)
+_QUALITY: dict[str, tuple[str, str]] = {
+    "low": ("-ql", "480p15"),
+    "medium": ("-qm", "720p30"),
+    "high": ("-qh", "1080p60"),
+    "ultra": ("-qk", "2160p60"),
 }
+_DEFAULT_QUALITY = _QUALITY["medium"]
+
+# Map quality names to Manim CLI flags
+QUALITY_FLAGS: dict[str, str] = {name: flag for name, (flag, _) in _QUALITY.items()}
 
 SCENE_CLASS_NAME = "GeneratedScene"
 
+# Only the end of Manim's log is kept; errors and tracebacks are printed last
+_OUTPUT_TAIL_LINES = 500
+
+# Manim's own report of where it wrote the video
+_READY_RE = re.compile(r"File ready at\s*['\"]([^'\"]+\.mp4)['\"]")
+
+# Keywords marking the start of the error context in Manim's output
+_ERROR_LINE_RE = re.compile(r"Error|Traceback|Exception|error:")
+_ERROR_SCAN_CHARS = 8192
+
 
 class RenderResult:
     """Result of a Manim render attempt."""
@@ -43,10 +61,16 @@ class ManimRenderer:
         self._cache_dir = cache_dir
         self._cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def write_script(self, code: str) -> Path:
-        """Write generated code to a temp .py file and return its path."""
-        script_path = self._cache_dir / f"scene_{uuid.uuid4().hex[:8]}.py"
-        script_path.write_text(code, encoding="utf-8")
+    def write_script(self, code: str, script_id: Optional[str] = None) -> Path:
+        """
+        Write generated code to a .py file in the cache dir and return its path.
+
+        Passing the same `script_id` overwrites one file (e.g. across the retries
+        of a correction loop) instead of leaving a new one behind per call.
+        """
+        script_path = self._cache_dir / f"scene_{script_id or uuid.uuid4().hex[:8]}.py"
+        with open(script_path, "w", encoding="utf-8", newline="\n") as f:
+            f.write(code)
         return script_path
 
     def render(
@@ -55,16 +79,18 @@ class ManimRenderer:
         quality: str,
         output_dir: Path,
         output_filename: Optional[str] = None,
+        script_id: Optional[str] = None,
     ) -> RenderResult:
         """
         Render a Manim scene from the given Python code string.
 
-        Returns a RenderResult with success status, output path, and any errors.
+        `script_id` is forwarded to write_script(). Returns a RenderResult with
+        success status, output path, and any errors.
         """
-        quality_flag = QUALITY_FLAGS.get(quality, "-qm")
+        quality_flag, quality_dir = _QUALITY.get(quality, _DEFAULT_QUALITY)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        script_path = self.write_script(code)
+        script_path = self.write_script(code, script_id)
 
         cmd = [
             "manim",
@@ -78,12 +104,7 @@ class ManimRenderer:
         log_info(f"Running Manim renderer at [bold]{quality}[/bold] quality…")
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5-minute timeout
-            )
+            returncode, combined_output = self._run_manim(cmd)
         except subprocess.TimeoutExpired:
             return RenderResult(
                 success=False,
@@ -98,8 +119,6 @@ class ManimRenderer:
                 ),
             )
 
-        combined_output = result.stdout + result.stderr
-
         # Detect ffmpeg missing — Manim raises FileNotFoundError internally
         # which shows up as a Python traceback in the output
         if "FileNotFoundError" in combined_output and "ffmpeg" in combined_output.lower():
@@ -128,17 +147,24 @@ class ManimRenderer:
                 stdout=combined_output,
             )
 
-        if result.returncode == 0:
+        if returncode == 0:
             # Find the output .mp4 file
-            mp4_path = self._find_output_mp4(output_dir / ".manim_media", quality)
+            mp4_path = self._reported_mp4(combined_output) or self._find_output_mp4(
+                output_dir / ".manim_media", quality_dir, script_path.stem
+            )
             if mp4_path:
                 # Copy to the user's output dir with custom or default name
                 fname = output_filename or f"{SCENE_CLASS_NAME}.mp4"
                 if not fname.endswith(".mp4"):
                     fname += ".mp4"
                 final_path = output_dir / fname
-                import shutil
-                shutil.copy2(mp4_path, final_path)
+                # Hardlink rather than copy: both paths live under output_dir, and
+                # the media-cache entry stays intact. Copy if linking fails
+                # (existing target, cross-device, or no hardlink support).
+                try:
+                    os.link(mp4_path, final_path)
+                except OSError:
+                    shutil.copy2(mp4_path, final_path)
                 return RenderResult(
                     success=True,
                     output_path=final_path,
@@ -159,19 +185,55 @@ class ManimRenderer:
             stdout=combined_output,
         )
 
-    def _find_output_mp4(self, media_dir: Path, quality: str) -> Optional[Path]:
-        """Search for the rendered .mp4 inside Manim's media directory."""
-        quality_dir_map = {
-            "low": "480p15",
-            "medium": "720p30",
-            "high": "1080p60",
-            "ultra": "2160p60",
-        }
-        subdir = quality_dir_map.get(quality, "720p30")
+    def _run_manim(self, cmd: list[str]) -> tuple[int, str]:
+        """
+        Run Manim and return its exit code and the tail of its combined output.
+
+        Output is drained line by line into a bounded buffer, so a verbose render
+        never holds its whole log in memory. Raises TimeoutExpired after 5 minutes.
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        tail: deque[str] = deque(maxlen=_OUTPUT_TAIL_LINES)
+        # Drain on a thread so the timeout still applies while Manim is silent
+        reader = threading.Thread(target=tail.extend, args=(proc.stdout,), daemon=True)
+        reader.start()
+        try:
+            returncode = proc.wait(timeout=300)  # 5-minute timeout
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        reader.join()
+        proc.stdout.close()
+        return returncode, "".join(tail)
+
+    @staticmethod
+    def _reported_mp4(output: str) -> Optional[Path]:
+        """Return the video path Manim printed, if it is present and exists."""
+        # Rich may wrap a long path across lines, in which case this misses
+        match = _READY_RE.search(output)
+        if match:
+            path = Path(match.group(1))
+            if path.is_file():
+                return path
+        return None
 
+    def _find_output_mp4(self, media_dir: Path, quality_dir: str, script_stem: str) -> Optional[Path]:
+        """Locate the rendered .mp4 inside Manim's media directory."""
         # Manim puts files in media_dir/videos/<script_name>/<quality>/
+        expected = media_dir / "videos" / script_stem / quality_dir / f"{SCENE_CLASS_NAME}.mp4"
+        if expected.exists():
+            return expected
+
+        # Unexpected layout (e.g. a different Manim version) — scan the tree
         for mp4 in media_dir.rglob("*.mp4"):
-            if subdir in str(mp4) or SCENE_CLASS_NAME in mp4.stem:
+            if quality_dir in str(mp4) or SCENE_CLASS_NAME in mp4.stem:
                 return mp4
         return None
 
@@ -185,14 +247,12 @@ class ManimRenderer:
 
     def _extract_error(self, output: str) -> str:
         """Extract the most relevant error lines from Manim output."""
-        lines = output.splitlines()
-        error_lines = []
-        capture = False
-        for line in lines:
-            if any(kw in line for kw in ("Error", "Traceback", "Exception", "error:")):
-                capture = True
-            if capture:
-                error_lines.append(line)
+        # Everything from the first line mentioning an error onwards is context.
+        # Tracebacks end the output, so look in its tail before scanning the rest.
+        tail_start = max(0, len(output) - _ERROR_SCAN_CHARS)
+        match = _ERROR_LINE_RE.search(output, tail_start) or _ERROR_LINE_RE.search(output, 0, tail_start)
+        if not match:
+            return output[-2000:]
+        start = output.rfind("\n", 0, match.start()) + 1
         # Return last 30 lines of error context
-        relevant = error_lines[-30:] if len(error_lines) > 30 else error_lines
-        return "\n".join(relevant) if relevant else output[-2000:]
+        return "\n".join(output[start:].splitlines()[-30:])
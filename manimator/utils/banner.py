@@ -0,0 +1,48 @@
+"""ASCII art banner for manimator."""
+
+import functools
+
+from rich.text import Text
+
+from manimator import __version__
+from manimator.utils.logger import console
+
+ASCII_BANNER = r"""
+ ███╗   ███╗ █████╗ ███╗   ██╗██╗███╗   ███╗ █████╗ ████████╗ ██████╗ ██████╗
+ ████╗ ████║██╔══██╗████╗  ██║██║████╗ ████║██╔══██╗╚══██╔══╝██╔═══██╗██╔══██╗
+ ██╔████╔██║███████║██╔██╗ ██║██║██╔████╔██║███████║   ██║   ██║   ██║██████╔╝
+ ██║╚██╔╝██║██╔══██║██║╚██╗██║██║██║╚██╔╝██║██╔══██║   ██║   ██║   ██║██╔══██╗
+ ██║ ╚═╝ ██║██║  ██║██║ ╚████║██║██║ ╚═╝ ██║██║  ██║   ██║   ╚██████╔╝██║  ██║
+ ╚═╝     ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝╚═╝╚═╝     ╚═╝╚═╝  ╚═╝   ╚═╝    ╚═════╝ ╚═╝  ╚═╝
+"""
+
+_COLORS = ["bright_cyan", "cyan", "bright_cyan", "cyan", "bright_cyan", "cyan"]
+
+
+@functools.lru_cache(maxsize=1)
+def _banner_text() -> Text:
+    """Build the styled banner once; it never changes within a process."""
+    banner = Text()
+    lines = ASCII_BANNER.rstrip().splitlines()
+    for i, line in enumerate(lines):
+        banner.append(line + "\n", style=f"bold {_COLORS[i % len(_COLORS)]}")
+    banner.append("\n")
+    banner.append_text(
+        Text.assemble(
+            "  ",
+            ("Natural Language", "dim"),
+            " ",
+            ("→", "bold magenta"),
+            " ",
+            ("Mathematical Animations", "dim"),
+            "   ",
+            (f"v{__version__}", "dim"),
+        )
+    )
+    return banner
+
+
+def print_banner() -> None:
+    """Print the ASCII art banner with Rich styling."""
+    console.print(_banner_text())
+    console.print()
@@ -1,42 +1,74 @@
 """Rich-based logging helpers for manimator."""
 
+import functools
+import sys
+
 from rich.console import Console
-from rich.syntax import Syntax
+from rich.markup import render
 from rich.panel import Panel
 from rich.text import Text
 
 console = Console()
 
+# Without a terminal Rich emits plain text anyway, so one-line messages skip its
+# layout and highlighting pass and are written directly.
+_PLAIN = not console.is_terminal
+
+
+def _print_line(markup: str) -> None:
+    if _PLAIN:
+        # emoji=True matches console.print, so :name: codes still become emoji when piped
+        sys.stdout.write(render(markup, emoji=True).plain + "\n")
+    else:
+        console.print(markup)
+
 
 def log_info(message: str) -> None:
     """Log an informational message."""
-    console.print(f"[bold cyan]ℹ[/bold cyan]  {message}")
+    _print_line(f"[bold cyan]ℹ[/bold cyan]  {message}")
 
 
 def log_success(message: str) -> None:
     """Log a success message."""
-    console.print(f"[bold green]✓[/bold green]  {message}")
+    _print_line(f"[bold green]✓[/bold green]  {message}")
 
 
 def log_error(message: str) -> None:
     """Log an error message."""
-    console.print(f"[bold red]✗[/bold red]  {message}")
+    _print_line(f"[bold red]✗[/bold red]  {message}")
 
 
 def log_warning(message: str) -> None:
     """Log a warning message."""
-    console.print(f"[bold yellow]⚠[/bold yellow]  {message}")
+    _print_line(f"[bold yellow]⚠[/bold yellow]  {message}")
 
 
 def log_step(step: int, total: int, message: str) -> None:
     """Log a numbered step."""
-    console.print(f"[bold magenta][{step}/{total}][/bold magenta] {message}")
+    _print_line(f"[bold magenta][{step}/{total}][/bold magenta] {message}")
+
+
+@functools.lru_cache(maxsize=1)
+def _python_highlighting():
+    """Build the Pygments lexer and theme once instead of per Syntax object."""
+    from pygments.lexers import PythonLexer
+    from rich.syntax import Syntax  # Deferred: pulls in Pygments, only needed for code panels
+
+    return PythonLexer(), Syntax.get_theme("monokai")
+
+
+@functools.lru_cache(maxsize=4)
+def _code_panel(code: str, title: str) -> Panel:
+    from rich.syntax import Syntax
+
+    lexer, theme = _python_highlighting()
+    syntax = Syntax(code, lexer, theme=theme, line_numbers=True)
+    return Panel(syntax, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan")
 
 
 def log_code(code: str, title: str = "Generated Manim Code") -> None:
     """Display syntax-highlighted Python code in a panel."""
-    syntax = Syntax(code, "python", theme="monokai", line_numbers=True)
-    console.print(Panel(syntax, title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan"))
+    console.print(_code_panel(code, title))
 
 
 def log_panel(message: str, title: str = "", style: str = "blue") -> None:
@@ -1,5 +1,6 @@
 """Cross-platform video preview utility."""
 
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -8,10 +9,16 @@ from pathlib import Path
 def open_video(path: str | Path) -> None:
     """Open a video file in the system's default media player."""
     path = str(path)
-    if sys.platform == "darwin":
-        subprocess.Popen(["open", path])
-    elif sys.platform == "win32":
-        subprocess.Popen(["start", path], shell=True)
-    else:
-        # Linux / BSD
-        subprocess.Popen(["xdg-open", path])
+    if sys.platform == "win32":
+        # ShellExecute directly — no cmd.exe just to run `start`
+        os.startfile(path)
+        return
+    opener = "open" if sys.platform == "darwin" else "xdg-open"  # Linux / BSD
+    # Detach the opener so it neither shares our terminal nor inherits our stdio
+    subprocess.Popen(
+        [opener, path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
@@ -0,0 +1,102 @@
+"""Shared pytest fixtures."""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+
+import pytest
+
+from manimator.providers.anthropic_provider import AnthropicProvider
+from manimator.providers.gemini_provider import GeminiProvider
+from manimator.providers.openai_provider import OpenAIProvider
+from manimator.renderer import SCENE_CLASS_NAME
+
+# (host, port) of servers started by local_http_server; the only addresses tests may reach
+_ALLOWED_ADDRESSES: set[tuple[str, int]] = set()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_network():
+    """
+    Fail any socket connection except to a server a test started itself.
+
+    Loopback is not exempt, so a real service on this machine (e.g. an Ollama
+    daemon on localhost:11434) can never leak into test results.
+    """
+    real_connect = socket.socket.connect
+
+    def guarded_connect(sock, address):
+        if isinstance(address, tuple) and tuple(address[:2]) not in _ALLOWED_ADDRESSES:
+            raise RuntimeError(f"network disabled in tests: connect to {address!r}")
+        return real_connect(sock, address)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(socket.socket, "connect", guarded_connect)
+        yield
+
+
+@pytest.fixture
+def local_http_server():
+    """Start an HTTPServer for a handler class on a free loopback port; the guard allows only it."""
+    servers: list[HTTPServer] = []
+
+    def start(handler: type[BaseHTTPRequestHandler]) -> HTTPServer:
+        # Threaded, like a real server, so one open client connection cannot block another
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        _ALLOWED_ADDRESSES.add(server.server_address)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        _ALLOWED_ADDRESSES.discard(server.server_address)
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope="session")
+def valid_scene_code() -> str:
+    return "from manim import *\nclass GeneratedScene(Scene): pass"
+
+
+@pytest.fixture
+def prepared_output_dir(tmp_path):
+    """An output dir whose Manim media tree already holds a rendered medium-quality video."""
+    out = tmp_path / "output"
+    video_dir = out / ".manim_media" / "videos" / "scene" / "720p30"
+    video_dir.mkdir(parents=True)
+    (video_dir / f"{SCENE_CLASS_NAME}.mp4").write_bytes(b"fake video data")
+    return out
+
+
+# Built once per session for read-only tests; tests that patch an SDK build their own.
+@pytest.fixture(scope="session")
+def openai_provider() -> OpenAIProvider:
+    return OpenAIProvider(api_key="test-key")
+
+
+@pytest.fixture(scope="session")
+def anthropic_provider() -> AnthropicProvider:
+    return AnthropicProvider(api_key="test-key")
+
+
+@pytest.fixture(scope="session")
+def gemini_provider() -> GeminiProvider:
+    return GeminiProvider(api_key="test-key")
+
+
+# list_models() results for structure-only tests, fetched once per session
+@pytest.fixture(scope="session")
+def openai_models(openai_provider):
+    return openai_provider.list_models()
+
+
+@pytest.fixture(scope="session")
+def anthropic_models(anthropic_provider):
+    return anthropic_provider.list_models()
+
+
+@pytest.fixture(scope="session")
+def gemini_models(gemini_provider):
+    return gemini_provider.list_models()
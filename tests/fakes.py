@@ -0,0 +1,42 @@
+"""In-process fakes for tests of code that calls an LLM provider."""
+
+from collections.abc import Iterator, Sequence
+
+from manimator.providers.base import LLMProvider, ModelSpec
+
+
+class FakeProvider(LLMProvider):
+    """
+    A real LLMProvider that answers from canned responses instead of an API.
+
+    Responses are handed out in order across all generate methods, and the last
+    one repeats once the rest are used up. Each call appends its method name to
+    `calls` (generate_batch once per prompt).
+    """
+
+    def __init__(self, *responses: str, model: str = "fake-model") -> None:
+        self._model = model
+        self._responses = list(responses) or [""]
+        self.calls: list[str] = []
+
+    def _next(self, method: str) -> str:
+        self.calls.append(method)
+        return self._responses.pop(0) if len(self._responses) > 1 else self._responses[0]
+
+    def generate(self, system_prompt: str, user_prompt: str) -> str:
+        return self._next("generate")
+
+    def generate_stream(self, system_prompt: str, user_prompt: str) -> Iterator[str]:
+        # Two chunks, so callers that join streamed text are exercised
+        text = self._next("generate_stream")
+        half = len(text) // 2
+        yield from filter(None, (text[:half], text[half:]))
+
+    def generate_with_history(self, system_prompt: str, messages: Sequence[dict]) -> str:
+        return self._next("generate_with_history")
+
+    def generate_batch(self, system_prompt: str, user_prompts: Sequence[str]) -> list[str]:
+        return [self._next("generate_batch") for _ in user_prompts]
+
+    def list_models(self) -> Sequence[ModelSpec]:
+        return (ModelSpec(name=self._model, context="", speed="", description="fake"),)
@@ -0,0 +1,76 @@
+"""Tests for the Typer CLI entry point."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _import_time_log(module: str) -> str:
+    """Return the `-X importtime` log for importing `module` in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stderr
+
+
+class TestVersionFastPath:
+    def test_version_skips_typer(self):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "manimator", "--version"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+        assert result.stdout.startswith("manimator version ")
+        assert "typer" not in imported
+
+    def test_importing_cli_ignores_host_argv(self):
+        # e.g. `pytest -V` must not be answered by merely importing the CLI module
+        code = "import sys; sys.argv = ['host', '-V']; import manimator.cli; print('imported')"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "imported"
+
+
+class TestCommandRegistration:
+    def test_imported_app_registers_every_command(self):
+        from manimator.cli import _COMMANDS, app
+
+        assert {info.name for info in app.registered_commands} == set(_COMMANDS)
+
+    def test_entry_point_registers_only_the_invoked_command(self):
+        from manimator.cli import app, app_for_argv
+
+        assert [info.name for info in app_for_argv(["--verbose", "create", "x"]).registered_commands] == ["create"]
+        assert app_for_argv(["--help"]) is app
+        assert app_for_argv(["no-such-command"]) is app
+
+
+class TestCliImportCost:
+    @pytest.mark.parametrize(
+        "heavy_module",
+        ["anthropic", "openai", "google.genai", "keyring", "manimator.renderer"],
+    )
+    def test_cli_import_does_not_load_heavy_modules(self, heavy_module):
+        log = _import_time_log("manimator.cli")
+        imported = {line.rsplit("|", 1)[-1].strip() for line in log.splitlines()}
+        assert heavy_module not in imported
+
+    def test_package_import_loads_no_submodules(self):
+        # manimator.cli always executes manimator/__init__.py first, so it must stay trivial
+        log = _import_time_log("manimator")
+        imported = {line.rsplit("|", 1)[-1].strip() for line in log.splitlines()}
+        assert {name for name in imported if name.startswith("manimator.")} == set()
+        assert "typer" not in imported
+
+    def test_package_reexports_are_lazy(self):
+        import manimator
+        from manimator.renderer import ManimRenderer
+
+        assert manimator.ManimRenderer is ManimRenderer
+        with pytest.raises(AttributeError):
+            manimator.DoesNotExist
@@ -0,0 +1,28 @@
+"""Tests for option handling shared by the create and chat commands."""
+
+import pytest
+import typer
+
+from manimator.commands import chat, create
+
+
+class TestProviderOption:
+    def test_create_rejects_unknown_provider(self):
+        with pytest.raises(typer.Exit):
+            create.run("a circle", provider="no-such-provider")
+
+    def test_chat_rejects_unknown_provider(self):
+        with pytest.raises(typer.Exit):
+            chat.run(provider="no-such-provider")
+
+    def test_provider_is_matched_case_insensitively(self, monkeypatch):
+        seen = []
+
+        def fake_get_provider(name, *args, **kwargs):
+            seen.append(name)
+            raise typer.Exit(1)
+
+        monkeypatch.setattr(create, "get_provider", fake_get_provider)
+        with pytest.raises(typer.Exit):
+            create.run("a circle", provider="OpenAI")
+        assert seen == ["openai"]
@@ -1,9 +1,7 @@
 """Tests for ConfigManager."""
 
 import json
-import tempfile
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
@@ -19,6 +17,7 @@ class TestManimatorConfig:
         assert cfg.default_quality == "medium"
         assert cfg.auto_preview is False
         assert cfg.verbose is False
+        assert cfg.cache_responses is False
 
     def test_custom_values(self):
         cfg = ManimatorConfig(
@@ -80,6 +79,18 @@ class TestConfigManager:
             cfg = manager.load()
         assert isinstance(cfg, ManimatorConfig)
 
+    @pytest.mark.parametrize(
+        "edited", [{"max_retries": 0}, {"default_quality": "extreme"}, {"max_retries": "three"}]
+    )
+    def test_load_hand_edited_file_is_validated(self, tmp_path, edited):
+        manager = ConfigManager()
+        config_file = tmp_path / "config.json"
+        defaults = ManimatorConfig().model_dump()
+        config_file.write_text(json.dumps({**defaults, **edited}), encoding="utf-8")
+        with patch.object(manager, "_config_path", config_file):
+            cfg = manager.load()
+        assert cfg == ManimatorConfig()
+
     def test_get_api_key_from_env(self, monkeypatch):
         monkeypatch.setenv("OPENAI_API_KEY", "test-key-123")
         manager = ConfigManager()
@@ -87,6 +98,20 @@ class TestConfigManager:
             key = manager.get_api_key("openai")
         assert key == "test-key-123"
 
+    def test_get_api_key_caches_keyring_lookup(self):
+        manager = ConfigManager()
+        with patch("keyring.get_password", return_value="sk-cached") as mock_get:
+            assert manager.get_api_key("openai") == "sk-cached"
+            assert manager.get_api_key("openai") == "sk-cached"
+        mock_get.assert_called_once()
+
+    def test_set_api_key_updates_cache(self):
+        manager = ConfigManager()
+        with patch("keyring.get_password", return_value=None), patch("keyring.set_password"):
+            manager.get_api_key("anthropic")
+            manager.set_api_key("anthropic", "sk-new")
+            assert manager.get_api_key("anthropic") == "sk-new"
+
     def test_masked_config_masks_key(self, monkeypatch):
         monkeypatch.setenv("OPENAI_API_KEY", "sk-abcdefghijklmnopqrstuvwxyz1234")
         manager = ConfigManager()
@@ -96,3 +121,11 @@ class TestConfigManager:
         assert "api_key" in masked
         assert "sk-abcde" in masked["api_key"]
         assert "1234" in masked["api_key"]
+
+    def test_masked_config_includes_all_fields(self):
+        manager = ConfigManager()
+        cfg = ManimatorConfig(provider="ollama")
+        with patch("keyring.get_password", return_value=None):
+            masked = manager.masked_config(cfg)
+        masked.pop("api_key")
+        assert masked == cfg.model_dump()
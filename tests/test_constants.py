@@ -0,0 +1,25 @@
+"""Tests for shared constants and validators."""
+
+import pytest
+import typer
+
+from manimator.constants import (
+    PROVIDERS_ORDERED,
+    QUALITY_CHOICES,
+    QUALITY_CHOICES_ORDERED,
+    VALID_PROVIDERS,
+    validate_choice,
+)
+
+
+class TestValidateChoice:
+    def test_valid_value_is_returned(self):
+        assert validate_choice("high", "quality", QUALITY_CHOICES, QUALITY_CHOICES_ORDERED) == "high"
+
+    def test_matching_is_case_insensitive(self):
+        assert validate_choice("LOW", "quality", QUALITY_CHOICES, QUALITY_CHOICES_ORDERED) == "low"
+        assert validate_choice("Anthropic", "provider", VALID_PROVIDERS, PROVIDERS_ORDERED) == "anthropic"
+
+    def test_invalid_value_exits(self):
+        with pytest.raises(typer.Exit):
+            validate_choice("extreme", "quality", QUALITY_CHOICES, QUALITY_CHOICES_ORDERED)
@@ -1,10 +1,5 @@
 """Tests for conversation manager and follow-up features."""
 
-from pathlib import Path
-from unittest.mock import MagicMock, patch
-
-import pytest
-
 from manimator.conversation import (
     ConversationManager,
     generate_video_name,
@@ -60,6 +55,12 @@ class TestGenerateUniqueFilename:
         result = generate_unique_filename(tmp_path, "test", 1)
         assert result == tmp_path / "test_v4.mp4"
 
+    def test_fills_gap_before_existing_versions(self, tmp_path):
+        (tmp_path / "test_v2.mp4").write_bytes(b"fake")
+        (tmp_path / "test_v10.mp4").write_bytes(b"fake")
+        assert generate_unique_filename(tmp_path, "test", 1) == tmp_path / "test_v1.mp4"
+        assert generate_unique_filename(tmp_path, "test", 2) == tmp_path / "test_v3.mp4"
+
     def test_creates_output_dir_if_missing(self, tmp_path):
         out = tmp_path / "new_dir" / "subdir"
         result = generate_unique_filename(out, "test", 1)
@@ -105,10 +106,37 @@ class TestConversationManager:
         msgs.clear()
         assert len(cm.get_messages()) == 1  # original unaffected
 
+    def test_messages_view_tracks_history(self):
+        cm = ConversationManager()
+        view = cm.messages
+        cm.add_user_message("test")
+        assert list(view) == [{"role": "user", "content": "test"}]
+
+    def test_max_messages_drops_oldest_followups(self):
+        cm = ConversationManager(max_messages=4)
+        view = cm.messages
+        for i in range(3):
+            cm.add_user_message(f"ask {i}")
+            cm.add_assistant_message(f"code {i}")
+        assert [m["content"] for m in view] == ["ask 0", "code 0", "ask 2", "code 2"]
+        cm.add_user_message("ask 3")
+        assert [m["content"] for m in view] == ["ask 0", "code 0", "ask 3"]
+
+    def test_max_messages_keeps_first_exchange_in_long_sessions(self):
+        cm = ConversationManager(max_messages=6)
+        for i in range(20):
+            cm.add_user_message(f"ask {i}")
+            cm.add_assistant_message(f"code {i}")
+        roles = [m["role"] for m in cm.messages]
+        assert [m["content"] for m in cm.messages[:2]] == ["ask 0", "code 0"]
+        assert cm.messages[-1]["content"] == "code 19"
+        assert roles == ["user", "assistant"] * (len(roles) // 2)
+        assert len(cm) <= 6
+
 
 class TestBuildFollowupPrompt:
-    def test_includes_previous_code(self):
-        result = build_followup_prompt("make it red", "from manim import *\nclass GeneratedScene(Scene): pass")
+    def test_includes_previous_code(self, valid_scene_code):
+        result = build_followup_prompt("make it red", valid_scene_code)
         assert "from manim import *" in result
         assert "GeneratedScene" in result
 
@@ -152,3 +180,30 @@ class TestBaseProviderFallback:
         provider = MockProvider()
         result = provider.generate_with_history("system", [])
         assert result == "GENERATED:"
+
+    def test_generate_batch_marshals_prompts_into_one_call(self):
+        calls = []
+
+        class MockProvider(LLMProvider):
+            def generate(self, system_prompt: str, user_prompt: str) -> str:
+                calls.append(user_prompt)
+                return "<ANSWER 2>second</ANSWER 2>\n<ANSWER 1>first</ANSWER 1>\n<ANSWER 3>third</ANSWER 3>"
+
+        result = MockProvider().generate_batch("system", ["a", "b", "c"])
+        assert result == ["first", "second", "third"]
+        assert len(calls) == 1
+        assert "<TASK 3>\nc\n</TASK 3>" in calls[0]
+
+    def test_generate_batch_reruns_missing_answers_alone(self):
+        calls = []
+
+        class MockProvider(LLMProvider):
+            def generate(self, system_prompt: str, user_prompt: str) -> str:
+                calls.append(user_prompt)
+                if len(calls) == 1:
+                    return "<ANSWER 2>second</ANSWER 2>\n<ANSWER 1>first</ANSWER 1>"
+                return f"alone:{user_prompt}"
+
+        result = MockProvider().generate_batch("system", ["a", "b", "c"])
+        assert result == ["first", "second", "alone:c"]
+        assert calls[1:] == ["c"]
@@ -0,0 +1,75 @@
+"""Tests for the auto-correction loop and its helpers."""
+
+from unittest.mock import MagicMock, patch
+
+from manimator.corrector import AutoCorrector, _extract_code_block, _validate_python_syntax
+from manimator.renderer import RenderResult
+from tests.fakes import FakeProvider
+
+GOOD_CODE = "from manim import *\nclass GeneratedScene(Scene): pass"
+
+
+class TestExtractCodeBlock:
+    def test_plain_code_is_unchanged(self):
+        assert _extract_code_block("  x = 1\n") == "x = 1"
+
+    def test_strips_language_fence(self):
+        assert _extract_code_block("```python\nx = 1\ny = 2\n```") == "x = 1\ny = 2"
+
+    def test_missing_closing_fence(self):
+        assert _extract_code_block("```python\nx = 1") == "x = 1"
+
+    def test_fence_only(self):
+        assert _extract_code_block("```python") == ""
+
+
+class TestValidatePythonSyntax:
+    def test_valid_code(self):
+        assert _validate_python_syntax("x = 1") == (True, "")
+
+    def test_invalid_code_reports_line(self):
+        valid, error = _validate_python_syntax("x = (\n")
+        assert not valid
+        assert error.startswith("SyntaxError at line")
+
+
+class TestCorrectionLoop:
+    def _corrector(self, *results, responses=(GOOD_CODE,), max_retries=2):
+        provider = FakeProvider(*responses)
+        renderer = MagicMock()
+        renderer.render.side_effect = list(results)
+        return AutoCorrector(provider, renderer, max_retries=max_retries), provider
+
+    def test_run_retries_then_succeeds(self, tmp_path):
+        out = tmp_path / "out.mp4"
+        fixed_code = GOOD_CODE + "\n# fixed"
+        corrector, provider = self._corrector(
+            RenderResult(success=False, error="NameError"),
+            RenderResult(success=True, output_path=out),
+            responses=(GOOD_CODE, fixed_code),
+        )
+        assert corrector.run("a circle", "low", tmp_path) == (out, fixed_code)
+        assert provider.calls == ["generate_stream", "generate_stream"]
+        # Both attempts reuse one script file
+        script_ids = {c.kwargs["script_id"] for c in corrector._renderer.render.call_args_list}
+        assert len(script_ids) == 1
+
+    def test_followup_env_error_fails_fast(self, tmp_path):
+        corrector, provider = self._corrector(RenderResult(success=False, error="ENV_ERROR: ffmpeg not found"))
+        path, code = corrector.run_followup([{"role": "user", "content": "x"}], "low", tmp_path)
+        assert path is None
+        assert code == GOOD_CODE
+        assert provider.calls == ["generate_with_history"]
+
+    def test_repeated_code_is_not_rendered_again(self, tmp_path):
+        corrector, provider = self._corrector(RenderResult(success=False, error="NameError"), max_retries=1)
+        path, _ = corrector.run("a circle", "low", tmp_path)
+        assert path is None
+        assert corrector._renderer.render.call_count == 1
+        assert provider.calls == ["generate_stream", "generate_stream"]
+
+    def test_env_error_shows_matching_install_hint(self, tmp_path):
+        corrector, _ = self._corrector(RenderResult(success=False, error="ENV_ERROR: LaTeX compilation failed."))
+        with patch("manimator.corrector.log_panel") as mock_panel:
+            corrector.run("a circle", "low", tmp_path)
+        assert mock_panel.call_args.kwargs["title"] == "Missing Dependency: LaTeX"
@@ -0,0 +1,27 @@
+"""Tests for the optional-orjson JSON helpers."""
+
+import json
+
+import pytest
+
+from manimator.utils import fastjson
+
+DATA = {"provider": "gemini", "output_dir": "/tmp/vidéos", "max_retries": 3}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(fastjson, "orjson", None)
+        monkeypatch.setattr(fastjson, "json", json, raising=False)
+    elif fastjson.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def test_roundtrip(backend):
+    assert fastjson.loads(fastjson.dumps(DATA)) == DATA
+
+
+def test_indent_uses_two_spaces(backend):
+    assert fastjson.dumps(DATA, indent=True).splitlines()[1].startswith(b'  "provider"')
@@ -0,0 +1,34 @@
+"""Tests for the list-models command helpers."""
+
+import subprocess
+import sys
+
+import pytest
+import typer
+
+from manimator.commands.list_models import _static_models, run
+from manimator.providers.anthropic_provider import ANTHROPIC_MODELS
+
+class TestStaticModels:
+    def test_returns_bundled_list(self):
+        assert _static_models("anthropic") is ANTHROPIC_MODELS
+
+    @pytest.mark.parametrize(
+        ("provider_name", "sdk"),
+        [("openai", "openai"), ("anthropic", "anthropic"), ("gemini", "google.genai")],
+    )
+    def test_does_not_import_sdk(self, provider_name, sdk):
+        code = (
+            "import sys\n"
+            "from manimator.commands.list_models import _static_models\n"
+            f"_static_models({provider_name!r})\n"
+            f"print({sdk!r} in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+
+class TestRun:
+    def test_unknown_provider_exits(self):
+        with pytest.raises(typer.Exit):
+            run(provider="no-such-provider")
@@ -0,0 +1,29 @@
+"""Tests for the logging helpers."""
+
+import subprocess
+import sys
+
+from manimator.utils import logger
+
+
+class TestPlainOutput:
+    def test_messages_are_written_without_markup(self, monkeypatch, capsys):
+        monkeypatch.setattr(logger, "_PLAIN", True)
+        logger.log_info("Rendering at [bold]high[/bold] quality")
+        logger.log_step(1, 3, "Generating")
+        assert capsys.readouterr().out == "ℹ  Rendering at high quality\n[1/3] Generating\n"
+
+    def test_emoji_codes_are_replaced(self, monkeypatch, capsys):
+        monkeypatch.setattr(logger, "_PLAIN", True)
+        logger.log_success("Done :rocket:")
+        assert capsys.readouterr().out == "✓  Done 🚀\n"
+
+    def test_code_panel_is_reused_for_identical_code(self):
+        code = "from manim import *"
+        assert logger._code_panel(code, "Code") is logger._code_panel(code, "Code")
+
+
+def test_import_defers_syntax_highlighting():
+    code = "import sys, manimator.utils.logger; print('rich.syntax' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
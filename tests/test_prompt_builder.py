@@ -45,11 +45,10 @@ class TestBuildUserPrompt:
 
 
 class TestBuildCorrectionPrompt:
-    def test_contains_original_code(self):
-        code = "from manim import *\nclass GeneratedScene(Scene): pass"
+    def test_contains_original_code(self, valid_scene_code):
         error = "NameError: name 'Foo' is not defined"
-        prompt = build_correction_prompt(code, error)
-        assert code in prompt
+        prompt = build_correction_prompt(valid_scene_code, error)
+        assert valid_scene_code in prompt
 
     def test_contains_error(self):
         code = "some code"
@@ -0,0 +1,92 @@
+"""Tests for the on-disk LLM response cache."""
+
+import asyncio
+import threading
+
+from manimator.providers.cache import CachingProvider, LLMCache
+from tests.fakes import FakeProvider
+
+CODE = "from manim import *\nclass GeneratedScene(Scene): pass"
+
+
+def _inner(response=CODE):
+    return FakeProvider(response, model="test-model")
+
+
+class TestLLMCache:
+    def test_miss_then_hit(self, tmp_path):
+        cache = LLMCache(tmp_path / "responses.sqlite3")
+        assert cache.get("k") is None
+        cache.set("k", "value")
+        assert cache.get("k") == "value"
+
+    def test_expired_entries_are_ignored(self, tmp_path):
+        cache = LLMCache(tmp_path / "responses.sqlite3", ttl=-1)
+        cache.set("k", "value")
+        assert cache.get("k") is None
+
+    def test_usable_from_other_threads(self, tmp_path):
+        cache = LLMCache(tmp_path / "responses.sqlite3")
+        cache.set("k", "value")  # connection opened on this thread
+        results = []
+        worker = threading.Thread(target=lambda: results.append(cache.get("k")))
+        worker.start()
+        worker.join()
+        assert results == ["value"]
+
+    def test_key_is_order_independent(self):
+        assert LLMCache.make_key(a=1, b=2) == LLMCache.make_key(b=2, a=1)
+        assert LLMCache.make_key(a=1) != LLMCache.make_key(a=2)
+
+
+class TestCachingProvider:
+    def test_generate_is_served_from_cache(self, tmp_path):
+        inner = _inner()
+        provider = CachingProvider(inner, LLMCache(tmp_path / "responses.sqlite3"))
+        assert provider.generate("system", "user") == CODE
+        assert provider.generate("system", "user") == CODE
+        assert inner.calls == ["generate"]
+
+    def test_stream_populates_cache_for_generate(self, tmp_path):
+        inner = _inner()
+        provider = CachingProvider(inner, LLMCache(tmp_path / "responses.sqlite3"))
+        assert "".join(provider.generate_stream("system", "user")) == CODE
+        assert provider.generate("system", "user") == CODE
+        assert inner.calls == ["generate_stream"]
+
+    def test_history_keys_on_messages(self, tmp_path):
+        inner = _inner()
+        provider = CachingProvider(inner, LLMCache(tmp_path / "responses.sqlite3"))
+        provider.generate_with_history("system", [{"role": "user", "content": "a"}])
+        provider.generate_with_history("system", [{"role": "user", "content": "b"}])
+        assert inner.calls == ["generate_with_history", "generate_with_history"]
+
+    def test_empty_response_is_not_cached(self, tmp_path):
+        inner = _inner(response="")
+        provider = CachingProvider(inner, LLMCache(tmp_path / "responses.sqlite3"))
+        provider.generate("system", "user")
+        provider.generate("system", "user")
+        assert inner.calls == ["generate", "generate"]
+
+    def test_abatch_caches_from_worker_threads(self, tmp_path):
+        inner = _inner()
+        provider = CachingProvider(inner, LLMCache(tmp_path / "responses.sqlite3"))
+        assert asyncio.run(provider.abatch("system", ["a", "b"])) == [CODE, CODE]
+        assert asyncio.run(provider.abatch("system", ["a", "b"])) == [CODE, CODE]
+        assert inner.calls == ["generate", "generate"]
+
+    def test_generate_batch_caches_each_prompt(self, tmp_path):
+        inner = _inner()
+        provider = CachingProvider(inner, LLMCache(tmp_path / "responses.sqlite3"))
+        assert provider.generate("system", "a") == CODE
+        assert provider.generate_batch("system", ["a", "b", "c"]) == [CODE] * 3
+        assert provider.generate_batch("system", ["c", "b"]) == [CODE] * 2
+        # Only the misses ("b" and "c") reached the provider; the second batch was all hits
+        assert inner.calls == ["generate", "generate_batch", "generate_batch"]
+
+    def test_generate_batch_of_variants_bypasses_cache(self, tmp_path):
+        inner = _inner()
+        provider = CachingProvider(inner, LLMCache(tmp_path / "responses.sqlite3"))
+        provider.generate("system", "same")
+        provider.generate_batch("system", ["same", "same"])
+        assert inner.calls == ["generate", "generate_batch", "generate_batch"]
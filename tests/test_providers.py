@@ -1,141 +1,370 @@
 """Tests for LLM providers (mocked API calls)."""
 
-from unittest.mock import patch, MagicMock
+import asyncio
+import inspect
+import json
+import threading
+from http.server import BaseHTTPRequestHandler
+from urllib.error import URLError
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch, MagicMock
 
 import pytest
 
-from manimator.providers.openai_provider import OpenAIProvider, OPENAI_MODELS
+from manimator.providers import ModelSpec, gemini_provider, ollama_provider, openai_provider
+from manimator.providers.openai_provider import OpenAIProvider
 from manimator.providers.anthropic_provider import AnthropicProvider, ANTHROPIC_MODELS
 from manimator.providers.ollama_provider import OllamaProvider, OLLAMA_RECOMMENDED_MODELS
 from manimator.providers.gemini_provider import GeminiProvider, GEMINI_MODELS
 
+SCENE_CODE = "from manim import *\nclass GeneratedScene(Scene): pass"
+
+# Plain response objects shaped like each SDK's; never mutated, so shared across tests
+_OPENAI_RESPONSE = SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=SCENE_CODE))])
+_ANTHROPIC_RESPONSE = SimpleNamespace(content=[SimpleNamespace(text=SCENE_CODE)])
+_GEMINI_RESPONSE = SimpleNamespace(text=SCENE_CODE)
+
+# What the Ollama helper raises when the server is down; built once and reused
+_CONN_REFUSED = URLError("connection refused")
+
+
+def _openai_choice(**fields) -> SimpleNamespace:
+    """One OpenAI `choices` entry, e.g. _openai_choice(message=...) or (delta=...)."""
+    return SimpleNamespace(**{k: SimpleNamespace(content=v) for k, v in fields.items()})
+
+
+@pytest.fixture
+def fake_openai(monkeypatch) -> MagicMock:
+    """Stand-in client returned by every `openai.OpenAI(...)` call."""
+    client = MagicMock()
+    monkeypatch.setattr("openai.OpenAI", lambda **kwargs: client)
+    return client
+
+
+@pytest.fixture
+def fake_anthropic(monkeypatch) -> MagicMock:
+    """Stand-in client returned by every `anthropic.Anthropic(...)` call."""
+    client = MagicMock()
+    monkeypatch.setattr("anthropic.Anthropic", lambda **kwargs: client)
+    return client
+
+
+@pytest.fixture
+def fake_genai(monkeypatch) -> MagicMock:
+    """Stand-in client returned by every `google.genai.Client(...)` call."""
+    client = MagicMock()
+    monkeypatch.setattr("google.genai.Client", lambda **kwargs: client)
+    return client
+
+
+@pytest.fixture
+def fake_ollama_request(monkeypatch) -> MagicMock:
+    """Replaces the Ollama HTTP helper; set its return_value or side_effect."""
+    request = MagicMock()
+    monkeypatch.setattr(ollama_provider, "_ollama_request", request)
+    return request
+
+
+@pytest.fixture
+def fake_ollama_server(local_http_server, monkeypatch):
+    """Points the Ollama provider at a local server running the given handler class."""
+    monkeypatch.setattr(ollama_provider, "_local", threading.local())
+
+    def start(handler: type[BaseHTTPRequestHandler]) -> None:
+        server = local_http_server(handler)
+        monkeypatch.setattr(ollama_provider, "OLLAMA_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+
+    yield start
+    # Close the keep-alive connection first, or the server's shutdown waits on it
+    ollama_provider._close_connection()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_sdk_clients():
+    # SDK clients are memoised per API key; drop them so each test sees its own mocks
+    openai_provider._get_client.cache_clear()
+    gemini_provider._get_client.cache_clear()
+    yield
+    openai_provider._get_client.cache_clear()
+    gemini_provider._get_client.cache_clear()
+
 
 class TestOpenAIProvider:
-    def test_list_models_returns_list(self):
-        provider = OpenAIProvider(api_key="test-key")
-        models = provider.list_models()
-        assert isinstance(models, list)
-        assert len(models) > 0
+    def test_list_models_returns_list(self, openai_models):
+        assert isinstance(openai_models, tuple) and openai_models
 
-    def test_list_models_have_required_keys(self):
-        provider = OpenAIProvider(api_key="test-key")
-        for model in provider.list_models():
-            assert "name" in model
-            assert "context" in model
-            assert "speed" in model
+    def test_list_models_have_required_keys(self, openai_models):
+        for model in openai_models:
+            assert isinstance(model, ModelSpec)
+            assert model.name
+            assert model.context
+            assert model.speed
 
-    def test_generate_calls_api(self):
-        mock_response = MagicMock()
-        mock_response.choices[0].message.content = "from manim import *\nclass GeneratedScene(Scene): pass"
+    def test_generate_calls_api(self, fake_openai):
+        fake_openai.chat.completions.create.return_value = _OPENAI_RESPONSE
 
-        with patch("manimator.providers.openai_provider.OpenAI") as mock_openai:
-            mock_client = MagicMock()
-            mock_openai.return_value = mock_client
-            mock_client.chat.completions.create.return_value = mock_response
+        result = OpenAIProvider(api_key="test-key", model="gpt-4o").generate("system prompt", "user prompt")
 
-            provider = OpenAIProvider(api_key="test-key", model="gpt-4o")
-            result = provider.generate("system prompt", "user prompt")
+        assert "GeneratedScene" in result
+
+    def test_default_model(self, openai_provider):
+        assert openai_provider._model == "gpt-4o"
+
+    def test_agenerate_uses_async_client(self):
+        with patch("openai.OpenAI"), patch("openai.AsyncOpenAI") as mock_async_openai:
+            mock_async_openai.return_value.chat.completions.create = AsyncMock(return_value=_OPENAI_RESPONSE)
+            provider = OpenAIProvider(api_key="test-key")
+            result = asyncio.run(provider.agenerate("system prompt", "user prompt"))
 
         assert "GeneratedScene" in result
+        sent = mock_async_openai.return_value.chat.completions.create.call_args.kwargs["messages"]
+        assert sent[0] == {"role": "system", "content": "system prompt"}
 
-    def test_default_model(self):
+    def test_abatch_preserves_prompt_order(self, fake_openai):
         provider = OpenAIProvider(api_key="test-key")
-        assert provider._model == "gpt-4o"
+        with patch.object(OpenAIProvider, "agenerate", new=AsyncMock(side_effect=lambda s, u: u.upper())):
+            assert asyncio.run(provider.abatch("system", ["a", "b", "c"])) == ["A", "B", "C"]
+
+    def test_generate_batch_of_variants_uses_n(self, fake_openai):
+        fake_openai.chat.completions.create.return_value = SimpleNamespace(
+            choices=[_openai_choice(message="one"), _openai_choice(message="two")]
+        )
+
+        provider = OpenAIProvider(api_key="test-key")
+        assert provider.generate_batch("system", ["same", "same"]) == ["one", "two"]
+        assert fake_openai.chat.completions.create.call_args.kwargs["n"] == 2
+
+    def test_generate_stream_yields_deltas(self, fake_openai):
+        chunks = [SimpleNamespace(choices=[_openai_choice(delta=text)]) for text in ("from manim ", None, "import *")]
+        fake_openai.chat.completions.create.return_value = iter(chunks)
+
+        provider = OpenAIProvider(api_key="test-key")
+        assert list(provider.generate_stream("system", "user")) == ["from manim ", "import *"]
+        assert fake_openai.chat.completions.create.call_args.kwargs["stream"] is True
+
+    def test_client_is_shared_per_api_key(self):
+        with patch("openai.OpenAI") as mock_openai:
+            first = OpenAIProvider(api_key="test-key")
+            second = OpenAIProvider(api_key="test-key", model="gpt-4o-mini")
+        assert first._client is second._client
+        mock_openai.assert_called_once_with(api_key="test-key")
 
 
 class TestAnthropicProvider:
-    def test_list_models_returns_list(self):
-        provider = AnthropicProvider(api_key="test-key")
-        models = provider.list_models()
-        assert isinstance(models, list)
-        assert len(models) > 0
+    def test_list_models_returns_list(self, anthropic_models):
+        assert isinstance(anthropic_models, tuple) and anthropic_models
 
     def test_list_models_have_required_keys(self):
         for model in ANTHROPIC_MODELS:
-            assert "name" in model
-            assert "context" in model
-            assert "speed" in model
-
-    def test_generate_calls_api(self):
-        mock_content = MagicMock()
-        mock_content.text = "from manim import *\nclass GeneratedScene(Scene): pass"
-        mock_response = MagicMock()
-        mock_response.content = [mock_content]
+            assert isinstance(model, ModelSpec)
+            assert model.name
+            assert model.context
+            assert model.speed
 
-        with patch("anthropic.Anthropic") as mock_anthropic:
-            mock_client = MagicMock()
-            mock_anthropic.return_value = mock_client
-            mock_client.messages.create.return_value = mock_response
+    def test_generate_calls_api(self, fake_anthropic):
+        fake_anthropic.messages.create.return_value = _ANTHROPIC_RESPONSE
 
-            provider = AnthropicProvider(api_key="test-key")
-            result = provider.generate("system prompt", "user prompt")
+        result = AnthropicProvider(api_key="test-key").generate("system prompt", "user prompt")
 
         assert "GeneratedScene" in result
 
+    def test_history_marks_prompt_cache_breakpoints(self, fake_anthropic):
+        messages = [{"role": "user", "content": "first"}, {"role": "assistant", "content": "reply"}]
+        create = fake_anthropic.messages.create
+        create.return_value = _ANTHROPIC_RESPONSE
+
+        AnthropicProvider(api_key="test-key").generate_with_history("system prompt", messages)
+
+        kwargs = create.call_args.kwargs
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["messages"][0] == messages[0]
+        assert kwargs["messages"][-1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert messages[-1] == {"role": "assistant", "content": "reply"}
+
+    def test_generate_stream_yields_text_deltas(self, fake_anthropic):
+        text_stream = iter(["from manim import *\n", "class GeneratedScene(Scene): pass"])
+        fake_anthropic.messages.stream.return_value.__enter__.return_value = SimpleNamespace(text_stream=text_stream)
+
+        chunks = list(AnthropicProvider(api_key="test-key").generate_stream("system prompt", "user prompt"))
+
+        assert "".join(chunks) == SCENE_CODE
+
 
 class TestOllamaProvider:
-    def test_list_models_returns_fallback_when_offline(self):
-        from urllib.error import URLError
-        with patch("manimator.providers.ollama_provider._ollama_request", side_effect=URLError("connection refused")):
-            provider = OllamaProvider()
-            models = provider.list_models()
+    def test_list_models_returns_fallback_when_offline(self, fake_ollama_request):
+        fake_ollama_request.side_effect = _CONN_REFUSED
+        models = OllamaProvider().list_models()
         assert models == OLLAMA_RECOMMENDED_MODELS
 
-    def test_list_models_from_running_ollama(self):
-        mock_response = {
+    def test_list_models_from_running_ollama(self, fake_ollama_request):
+        fake_ollama_request.return_value = {
             "models": [
                 {"name": "codellama:latest", "size": 4_000_000_000},
                 {"name": "llama3:latest", "size": 8_000_000_000},
             ]
         }
-        with patch("manimator.providers.ollama_provider._ollama_request", return_value=mock_response):
-            provider = OllamaProvider()
-            models = provider.list_models()
+        models = OllamaProvider().list_models()
         assert len(models) == 2
-        assert models[0]["name"] == "codellama:latest"
-
-    def test_generate_raises_on_connection_error(self):
-        from urllib.error import URLError
-        with patch("manimator.providers.ollama_provider._ollama_request", side_effect=URLError("refused")):
-            provider = OllamaProvider()
-            with pytest.raises(RuntimeError, match="Ollama"):
-                provider.generate("system", "user")
-
-    def test_generate_returns_content(self):
-        mock_response = {"message": {"content": "from manim import *\nclass GeneratedScene(Scene): pass"}}
-        with patch("manimator.providers.ollama_provider._ollama_request", return_value=mock_response):
-            provider = OllamaProvider()
-            result = provider.generate("system", "user")
+        assert models[0].name == "codellama:latest"
+
+    def test_generate_raises_on_connection_error(self, fake_ollama_request):
+        fake_ollama_request.side_effect = _CONN_REFUSED
+        with pytest.raises(RuntimeError, match="Ollama"):
+            OllamaProvider().generate("system", "user")
+
+    def test_generate_returns_content(self, fake_ollama_request):
+        fake_ollama_request.return_value = {"message": {"content": SCENE_CODE}}
+        result = OllamaProvider().generate("system", "user")
         assert "GeneratedScene" in result
 
+    def test_requests_reuse_one_connection(self, fake_ollama_server):
+        connections = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                connections.append(self.client_address)
+
+            def do_GET(self):
+                body = json.dumps({"models": []}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        fake_ollama_server(Handler)
+        assert ollama_provider._ollama_request("/api/tags") == {"models": []}
+        assert ollama_provider._ollama_request("/api/tags") == {"models": []}
+        assert len(connections) == 1
+
+    def test_generate_stream_yields_message_chunks(self, fake_ollama_server):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                assert payload["stream"] is True
+                events = [{"message": {"content": "from manim "}}, {"message": {"content": "import *"}}, {"done": True}]
+                body = b"".join(json.dumps(e).encode() + b"\n" for e in events)
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        fake_ollama_server(Handler)
+        assert list(OllamaProvider().generate_stream("system", "user")) == ["from manim ", "import *"]
+
+    def test_threads_do_not_share_a_connection(self, fake_ollama_server):
+        both_arrived = threading.Barrier(2, timeout=5)
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                both_arrived.wait()  # Breaks, failing the request, if calls are serialised
+                body = json.dumps({"models": []}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        fake_ollama_server(Handler)
+        results = []
+
+        def request():
+            results.append(ollama_provider._ollama_request("/api/tags"))
+            ollama_provider._close_connection()
+
+        workers = [threading.Thread(target=request, daemon=True) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=10)
+        assert results == [{"models": []}] * 2
+
+    def test_abandoned_stream_does_not_block_other_requests(self, fake_ollama_server):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                body = json.dumps({"models": []}).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers["Content-Length"]))
+                events = [{"message": {"content": "from manim "}}, {"message": {"content": "import *"}}]
+                body = b"".join(json.dumps(e).encode() + b"\n" for e in events)
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        fake_ollama_server(Handler)
+        stream = OllamaProvider().generate_stream("system", "user")
+        assert next(stream) == "from manim "
+
+        # The half-read stream is still referenced; a second request must not wait on it
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.append(ollama_provider._ollama_request("/api/tags")), daemon=True
+        )
+        worker.start()
+        worker.join(timeout=5)
+        assert results == [{"models": []}]
+        stream.close()
+
 
 class TestGeminiProvider:
-    def test_list_models_returns_list(self):
-        provider = GeminiProvider(api_key="test-key")
-        models = provider.list_models()
-        assert isinstance(models, list)
-        assert len(models) > 0
+    def test_list_models_returns_list(self, gemini_models):
+        assert isinstance(gemini_models, tuple) and gemini_models
 
     def test_list_models_have_required_keys(self):
         for model in GEMINI_MODELS:
-            assert "name" in model
-            assert "context" in model
-            assert "speed" in model
+            assert isinstance(model, ModelSpec)
+            assert model.name
+            assert model.context
+            assert model.speed
 
-    def test_generate_calls_api(self):
-        mock_response = MagicMock()
-        mock_response.text = "from manim import *\nclass GeneratedScene(Scene): pass"
+    def test_generate_calls_api(self, fake_genai):
+        fake_genai.models.generate_content.return_value = _GEMINI_RESPONSE
 
-        with patch("google.genai.Client") as mock_client_cls:
-            mock_client = MagicMock()
-            mock_client_cls.return_value = mock_client
-            mock_client.models.generate_content.return_value = mock_response
-
-            provider = GeminiProvider(api_key="test-key", model="gemini-2.5-flash")
-            result = provider.generate("system prompt", "user prompt")
+        provider = GeminiProvider(api_key="test-key", model="gemini-2.5-flash")
+        result = provider.generate("system prompt", "user prompt")
 
         assert "GeneratedScene" in result
 
-    def test_default_model(self):
+    def test_default_model(self, gemini_provider):
+        default = inspect.signature(GeminiProvider).parameters["model"].default
+        assert gemini_provider._model == default
+
+    def test_history_conversion_reuses_converted_prefix(self):
         provider = GeminiProvider(api_key="test-key")
-        assert provider._model == "gemini-2.5-flash"
+        messages = [{"role": "user", "content": "draw a circle"}]
+        first = provider._contents(messages)
+
+        messages.append({"role": "assistant", "content": "code"})
+        second = provider._contents(messages)
+        assert second[0] is first[0]
+        assert [c.role for c in second] == ["user", "model"]
+
+        edited = [{"role": "user", "content": "draw a square"}, messages[1]]
+        third = provider._contents(edited)
+        assert third[0] is not first[0]
+        assert third[0].parts[0].text == "draw a square"
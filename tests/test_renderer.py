@@ -1,7 +1,10 @@
 """Tests for ManimRenderer."""
 
+import io
 import subprocess
+import uuid
 from pathlib import Path
+from typing import Optional
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -9,91 +12,200 @@ import pytest
 from manimator.renderer import ManimRenderer, QUALITY_FLAGS, SCENE_CLASS_NAME
 
 
-class TestQualityFlags:
-    def test_all_qualities_mapped(self):
-        for quality in ["low", "medium", "high", "ultra"]:
-            assert quality in QUALITY_FLAGS
+class _FakeManim:
+    """
+    Stands in for subprocess.Popen. Set attributes to choose what Manim "does".
+
+    `proc` is the last process handed out, for assertions.
+    """
+
+    def __init__(self) -> None:
+        self.output = ""
+        self.returncode = 0
+        self.raise_exc: Optional[BaseException] = None
+        self.times_out = False
+        self.proc: Optional[MagicMock] = None
+
+    def __call__(self, cmd, **kwargs) -> MagicMock:
+        if self.raise_exc is not None:
+            raise self.raise_exc
+        proc = MagicMock()
+        proc.stdout = io.StringIO(self.output)
+        if self.times_out:
+            proc.wait.side_effect = [subprocess.TimeoutExpired(cmd=cmd, timeout=300), -9]
+        else:
+            proc.wait.return_value = self.returncode
+        self.proc = proc
+        return proc
+
+
+# (Manim output, text the extracted error must contain)
+_TRACEBACKS = [
+    pytest.param(
+        "Some normal output\nTraceback (most recent call last):\n  File 'x.py', line 5\n"
+        "NameError: name 'Foo' is not defined",
+        "NameError: name 'Foo' is not defined",
+        id="name-error",
+    ),
+    pytest.param(
+        "Some normal output\nTraceback (most recent call last):\n  File 'x.py', line 9, in construct\n"
+        "KeyError: 'x'",
+        "KeyError: 'x'",
+        id="key-error",
+    ),
+    pytest.param(
+        "Some normal output\nmanim: error: unrecognized arguments: --bogus",
+        "unrecognized arguments: --bogus",
+        id="cli-usage-error",
+    ),
+    pytest.param(
+        "Some normal output\nException: Latex error converting to dvi",
+        "Latex error converting to dvi",
+        id="exception",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def renderer(tmp_path_factory) -> ManimRenderer:
+    # ManimRenderer only remembers its cache dir, so one instance serves the module
+    return ManimRenderer(cache_dir=tmp_path_factory.mktemp("renderer_cache"))
+
+
+@pytest.fixture(scope="module")
+def render_base(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("render")
+
+
+@pytest.fixture
+def tmp_path(render_base) -> Path:
+    """Per-test subdir of one module-wide base dir, instead of a fresh pytest tmp dir per test."""
+    path = render_base / uuid.uuid4().hex
+    path.mkdir()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def fake_manim(monkeypatch) -> _FakeManim:
+    """Replace Popen for every test so nothing here can launch a real process."""
+    controller = _FakeManim()
+    monkeypatch.setattr("subprocess.Popen", controller)
+    return controller
+
 
-    def test_flag_values(self):
-        assert QUALITY_FLAGS["low"] == "-ql"
-        assert QUALITY_FLAGS["medium"] == "-qm"
-        assert QUALITY_FLAGS["high"] == "-qh"
-        assert QUALITY_FLAGS["ultra"] == "-qk"
+class TestQualityFlags:
+    @pytest.mark.parametrize(
+        ("quality", "expected"),
+        [("low", "-ql"), ("medium", "-qm"), ("high", "-qh"), ("ultra", "-qk")],
+    )
+    def test_quality_flag(self, quality, expected):
+        assert QUALITY_FLAGS[quality] == expected
 
 
 class TestManimRenderer:
-    def test_write_script(self, tmp_path):
-        renderer = ManimRenderer(cache_dir=tmp_path)
-        code = "from manim import *\nclass GeneratedScene(Scene): pass"
-        script_path = renderer.write_script(code)
+    def test_write_script(self, renderer, valid_scene_code):
+        script_path = renderer.write_script(valid_scene_code)
         assert script_path.exists()
-        assert script_path.read_text() == code
+        assert script_path.read_text() == valid_scene_code
         assert script_path.suffix == ".py"
 
-    def test_render_success(self, tmp_path):
-        renderer = ManimRenderer(cache_dir=tmp_path)
-        output_dir = tmp_path / "output"
-        output_dir.mkdir()
-
-        # Create a fake mp4 file that the renderer would find
-        media_dir = output_dir / ".manim_media"
-        media_dir.mkdir()
-        fake_mp4_dir = media_dir / "videos" / "scene" / "720p30"
-        fake_mp4_dir.mkdir(parents=True)
-        fake_mp4 = fake_mp4_dir / f"{SCENE_CLASS_NAME}.mp4"
-        fake_mp4.write_bytes(b"fake video data")
+    def test_write_script_with_id_overwrites_one_file(self, renderer):
+        first = renderer.write_script("first", script_id="abc")
+        second = renderer.write_script("second", script_id="abc")
+        assert first == second == renderer._cache_dir / "scene_abc.py"
+        assert second.read_text() == "second"
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Manim Community v0.18.0\nFile ready at..."
-        mock_result.stderr = ""
-
-        with patch("subprocess.run", return_value=mock_result):
-            result = renderer.render("some code", "medium", output_dir)
+    def test_render_success(self, renderer, prepared_output_dir, fake_manim):
+        fake_manim.output = "Manim Community v0.18.0\nFile ready at..."
+        result = renderer.render("some code", "medium", prepared_output_dir)
 
         assert result.success is True
         assert result.output_path is not None
 
-    def test_render_failure(self, tmp_path):
-        renderer = ManimRenderer(cache_dir=tmp_path)
+    def test_render_success_replaces_existing_output(self, renderer, prepared_output_dir):
+        (prepared_output_dir / "clip.mp4").write_bytes(b"old video data")
+
+        result = renderer.render("some code", "medium", prepared_output_dir, output_filename="clip")
+
+        assert result.output_path == prepared_output_dir / "clip.mp4"
+        assert result.output_path.read_bytes() == b"fake video data"
+
+    def test_render_uses_path_reported_by_manim(self, renderer, tmp_path, fake_manim):
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
+        reported = tmp_path / "elsewhere" / f"{SCENE_CLASS_NAME}.mp4"
+        reported.parent.mkdir()
+        reported.write_bytes(b"reported video")
+
+        fake_manim.output = f"INFO     File ready at '{reported}'\n"
+        with patch.object(ManimRenderer, "_find_output_mp4") as find:
+            result = renderer.render("some code", "medium", output_dir, output_filename="clip")
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Error: NameError: name 'Foo' is not defined\nTraceback..."
+        find.assert_not_called()
+        assert result.output_path.read_bytes() == b"reported video"
 
-        with patch("subprocess.run", return_value=mock_result):
-            result = renderer.render("bad code", "medium", output_dir)
+    def test_find_output_mp4_prefers_expected_path(self, renderer, tmp_path):
+        media_dir = tmp_path / ".manim_media"
+        stray = media_dir / "videos" / "scene_old" / "720p30" / f"{SCENE_CLASS_NAME}.mp4"
+        expected = media_dir / "videos" / "scene_new" / "720p30" / f"{SCENE_CLASS_NAME}.mp4"
+        for path in (stray, expected):
+            path.parent.mkdir(parents=True)
+            path.write_bytes(b"fake video data")
+
+        assert renderer._find_output_mp4(media_dir, "720p30", "scene_new") == expected
+
+    def test_render_failure(self, renderer, tmp_path, fake_manim):
+        output_dir = tmp_path / "output"
+
+        fake_manim.output = "Error: NameError: name 'Foo' is not defined\nTraceback..."
+        fake_manim.returncode = 1
+        result = renderer.render("bad code", "medium", output_dir)
 
         assert result.success is False
         assert "NameError" in result.error or len(result.error) > 0
 
-    def test_render_manim_not_found(self, tmp_path):
-        renderer = ManimRenderer(cache_dir=tmp_path)
+    def test_render_manim_not_found(self, renderer, tmp_path, fake_manim):
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
-        with patch("subprocess.run", side_effect=FileNotFoundError):
-            result = renderer.render("some code", "medium", output_dir)
+        fake_manim.raise_exc = FileNotFoundError()
+        result = renderer.render("some code", "medium", output_dir)
 
         assert result.success is False
         assert "not found" in result.error.lower() or "manim" in result.error.lower()
 
-    def test_render_timeout(self, tmp_path):
-        renderer = ManimRenderer(cache_dir=tmp_path)
+    def test_render_timeout(self, renderer, tmp_path, fake_manim):
         output_dir = tmp_path / "output"
-        output_dir.mkdir()
 
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd="manim", timeout=300)):
-            result = renderer.render("some code", "medium", output_dir)
+        fake_manim.times_out = True
+        result = renderer.render("some code", "medium", output_dir)
 
         assert result.success is False
         assert "timed out" in result.error.lower()
+        fake_manim.proc.kill.assert_called_once()
+
+    def test_run_manim_keeps_only_the_output_tail(self, renderer, fake_manim):
+        fake_manim.output = "".join(f"line {i}\n" for i in range(1000))
+        fake_manim.returncode = 3
+        returncode, tail = renderer._run_manim(["manim"])
 
-    def test_extract_error_from_output(self, tmp_path):
-        renderer = ManimRenderer(cache_dir=tmp_path)
-        output = "Some normal output\nTraceback (most recent call last):\n  File 'x.py', line 5\nNameError: name 'Foo' is not defined"
+        assert returncode == 3
+        assert tail.splitlines() == [f"line {i}" for i in range(500, 1000)]
+
+    @pytest.mark.parametrize(("output", "needle"), _TRACEBACKS)
+    def test_extract_error_from_output(self, renderer, output, needle):
+        error = renderer._extract_error(output)
+        assert needle in error
+        assert "Some normal output" not in error
+
+    def test_extract_error_keeps_last_30_lines_from_first_error(self, renderer):
+        noise = [f"frame {i}" for i in range(40)]
+        output = "\n".join(["Rendering…", "Traceback (most recent call last):", *noise, "ValueError: bad"])
         error = renderer._extract_error(output)
-        assert "NameError" in error or "Traceback" in error
+        assert error.splitlines() == [*noise[-29:], "ValueError: bad"]
+
+    def test_extract_error_finds_marker_before_scanned_tail(self, renderer):
+        output = "Traceback (most recent call last):\n" + "frame\n" * 3000
+        assert renderer._extract_error(output).splitlines() == ["frame"] * 30
+
+    def test_extract_error_without_keywords_returns_tail(self, renderer):
+        output = "x" * 3000
+        assert renderer._extract_error(output) == output[-2000:]